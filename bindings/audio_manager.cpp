@@ -2,7 +2,10 @@
 #include <pybind11/stl.h>
 #include <pybind11/chrono.h>
 #include <pybind11/operators.h>
+#include <cstdint>
 #include <functional>
+#include <string>
+#include <unordered_map>
 
 #include "audio_manager.h"
 #include "vec3.h"
@@ -10,9 +13,48 @@
 namespace py = pybind11;
 using namespace audio;
 
+namespace {
+
+// True if a buffer holds native-endian float32 items. Exporters may spell the
+// same format with a byte-order prefix (ctypes uses "<f"), so strip any prefix
+// that means native order before comparing.
+bool IsNativeFloat32(const py::buffer_info& info) {
+    if (info.itemsize != static_cast<py::ssize_t>(sizeof(float))) {
+        return false;
+    }
+    std::string format = info.format;
+    if (!format.empty()) {
+        const uint16_t probe = 1;
+        const bool little_endian = *reinterpret_cast<const uint8_t*>(&probe) == 1;
+        const char prefix = format[0];
+        if (prefix == '@' || prefix == '=' ||
+            (prefix == '<' && little_endian) ||
+            ((prefix == '>' || prefix == '!') && !little_endian)) {
+            format.erase(0, 1);
+        }
+    }
+    return format == py::format_descriptor<float>::format();
+}
+
+// Fade durations arrive from Python as timedelta or float seconds. The engine
+// counts whole milliseconds, so round to the nearest one, but never let a
+// positive duration round down to zero and be rejected as non-positive.
+std::chrono::milliseconds ToFadeDuration(std::chrono::duration<double> duration) {
+    auto ms = std::chrono::round<std::chrono::milliseconds>(duration);
+    if (ms.count() == 0 && duration.count() > 0.0) {
+        ms = std::chrono::milliseconds(1);
+    }
+    return ms;
+}
+
+}  // namespace
+
 void bind_audio_manager(py::module_& m) {
+    // Vec3 exposes its components as a contiguous float[3] buffer
+    static_assert(sizeof(Vec3) == 3 * sizeof(float), "Vec3 must be three packed floats");
+
     // Bind Vec3 for 3D positions
-    py::class_<Vec3>(m, "Vec3",
+    py::class_<Vec3>(m, "Vec3", py::buffer_protocol(),
         "3D vector for spatial audio positioning.\n\n"
         "Represents a position or direction in 3D space. This is engine-agnostic\n"
         "and can be used with any game engine by converting from the engine's\n"
@@ -25,7 +67,18 @@ void bind_audio_manager(py::module_& m) {
         "To convert from a game engine (e.g., Basilisk Engine nodes):\n"
         "  node_pos = node.get_position()\n"
         "  audio_pos = game_audio.Vec3(node_pos.x, node_pos.y, node_pos.z)\n"
-        "  audio.set_sound_position(sound, audio_pos)")
+        "  audio.set_sound_position(sound, audio_pos)\n\n"
+        "Vec3 supports the buffer protocol, so memoryview(v) (or numpy.asarray(v))\n"
+        "is a writable float32 view of (x, y, z) without copying.")
+        .def_buffer([](Vec3& v) -> py::buffer_info {
+            return py::buffer_info(
+                &v.x,
+                sizeof(float),
+                py::format_descriptor<float>::format(),
+                1,
+                { 3 },
+                { sizeof(float) });
+        })
         .def(py::init<>(), "Create a Vec3 at the origin (0, 0, 0)")
         .def(py::init<float, float, float>(), 
              py::arg("x"), py::arg("y"), py::arg("z"),
@@ -65,6 +118,31 @@ void bind_audio_manager(py::module_& m) {
              "    other (Vec3): Other point\n\n"
              "Returns:\n"
              "    float: Squared distance between points")
+        .def("distances", [](const Vec3& self, const std::vector<Vec3>& points) {
+                 std::vector<float> out;
+                 out.reserve(points.size());
+                 for (const auto& p : points) {
+                     out.push_back(self.Distance(p));
+                 }
+                 return out;
+             },
+             py::arg("points"),
+             "Calculate the distance to each of several points in one call.\n\n"
+             "Equivalent to [self.distance(p) for p in points] without a binding\n"
+             "round-trip per point; useful for culling many sources at once.\n\n"
+             "Args:\n"
+             "    points (list[Vec3]): Points to measure to\n\n"
+             "Returns:\n"
+             "    list[float]: Distance to each point, in the same order")
+        .def("allclose", &Vec3::AllClose,
+             py::arg("other"),
+             py::arg("atol") = 1e-4f,
+             "Check whether every component is within a tolerance of another vector.\n\n"
+             "Args:\n"
+             "    other (Vec3): Vector to compare against\n"
+             "    atol (float): Maximum absolute difference allowed per component\n\n"
+             "Returns:\n"
+             "    bool: True if x, y and z are all within atol")
         .def(py::self + py::self)
         .def(py::self - py::self)
         .def(py::self * float())
@@ -179,11 +257,13 @@ void bind_audio_manager(py::module_& m) {
         // System Control
         .def("set_master_volume", &AudioManager::SetMasterVolume,
              py::arg("volume"),
+             py::call_guard<py::gil_scoped_release>(),
              "Set the master volume for all audio.\n\n"
              "Args:\n"
              "    volume (float): Volume level (0.0 = silence, 1.0 = full volume)")
         
         .def("get_master_volume", &AudioManager::GetMasterVolume,
+             py::call_guard<py::gil_scoped_release>(),
              "Get the current master volume level.\n\n"
              "Returns:\n"
              "    float: Current master volume (0.0 to 1.0)")
@@ -197,6 +277,13 @@ void bind_audio_manager(py::module_& m) {
              "Get the current audio log level.\n\n"
              "Returns:\n"
              "    LogLevel: Current logging level")
+        .def_static("swap_log_level", &AudioManager::SwapLogLevel,
+             py::arg("level"),
+             "Set the global audio log level and return the previous one.\n\n"
+             "Args:\n"
+             "    level (LogLevel): Desired logging level\n\n"
+             "Returns:\n"
+             "    LogLevel: The logging level that was replaced")
         
         // Track Management
         .def("create_track", &AudioManager::CreateTrack,
@@ -207,12 +294,31 @@ void bind_audio_manager(py::module_& m) {
              "Raises:\n"
              "    AudioException: If track creation fails")
         
+        .def("create_tracks", &AudioManager::CreateTracks,
+             py::arg("count"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Create several audio tracks in one call.\n\n"
+             "Equivalent to calling create_track() count times.\n\n"
+             "Args:\n"
+             "    count (int): Number of tracks to create\n\n"
+             "Returns:\n"
+             "    list[TrackHandle]: Handles to the newly created tracks")
+        
         .def("destroy_track", &AudioManager::DestroyTrack,
              py::arg("track"),
              "Destroy an audio track.\n\n"
              "Args:\n"
              "    track (TrackHandle): Handle to the track to destroy")
         
+        .def("destroy_tracks", &AudioManager::DestroyTracks,
+             py::arg("tracks"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Destroy several audio tracks in one call.\n\n"
+             "Equivalent to calling destroy_track() for each handle. Unknown\n"
+             "handles are ignored.\n\n"
+             "Args:\n"
+             "    tracks (list[TrackHandle]): Handles to the tracks to destroy")
+        
         .def("play_track", &AudioManager::PlayTrack,
              py::arg("track"),
              "Start playing an audio track.\n\n"
@@ -237,6 +343,7 @@ void bind_audio_manager(py::module_& m) {
              py::arg("layer_name"),
              py::arg("filepath"),
              py::arg("group") = GroupHandle::Invalid(),
+             py::call_guard<py::gil_scoped_release>(),
              "Add an audio layer to a track.\n\n"
              "Layers are individual sounds that play simultaneously within a track.\n\n"
              "Args:\n"
@@ -266,17 +373,59 @@ void bind_audio_manager(py::module_& m) {
              "    layer_name (str): Name of the layer\n"
              "    volume (float): Volume level (0.0 to 1.0)")
         
-        .def("fade_layer", &AudioManager::FadeLayer,
+        .def("get_layer_volume", &AudioManager::GetLayerVolume,
+             py::arg("track"),
+             py::arg("layer_name"),
+             "Get the current volume of a specific layer.\n\n"
+             "Follows fade progress, so it reaches the target once a fade completes.\n\n"
+             "Args:\n"
+             "    track (TrackHandle): Handle to the track\n"
+             "    layer_name (str): Name of the layer\n\n"
+             "Returns:\n"
+             "    float: Current volume level (0.0 to 1.0), or 0.0 for an unknown layer\n\n"
+             "Raises:\n"
+             "    InvalidHandleException: If track handle is invalid")
+        
+        .def("fade_layer", [](AudioManager& self, TrackHandle track, const std::string& layerName,
+                              float targetVolume, std::chrono::duration<double> duration) {
+                 self.FadeLayer(track, layerName, targetVolume, ToFadeDuration(duration));
+             },
              py::arg("track"),
              py::arg("layer_name"),
              py::arg("target_volume"),
              py::arg("duration"),
+             py::call_guard<py::gil_scoped_release>(),
              "Fade a layer's volume to a target value over time.\n\n"
              "Args:\n"
              "    track (TrackHandle): Handle to the track\n"
              "    layer_name (str): Name of the layer\n"
              "    target_volume (float): Target volume level (0.0 to 1.0)\n"
-             "    duration (timedelta): Duration of the fade")
+             "    duration (timedelta | float): Duration of the fade; a float is seconds.\n"
+             "        Rounded to whole milliseconds; a positive duration is at least 1 ms\n\n"
+             "Raises:\n"
+             "    AudioException: If duration is zero or negative")
+        
+        .def("fade_layers", [](AudioManager& self, TrackHandle track,
+                               const std::unordered_map<std::string, float>& targetVolumes,
+                               std::chrono::duration<double> duration) {
+                 self.FadeLayers(track, targetVolumes, ToFadeDuration(duration));
+             },
+             py::arg("track"),
+             py::arg("target_volumes"),
+             py::arg("duration"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Fade several layers of a track at once.\n\n"
+             "Equivalent to calling fade_layer() for each entry, but all fades start\n"
+             "together in a single call. Useful for crossfading between layers.\n\n"
+             "Args:\n"
+             "    track (TrackHandle): Handle to the track\n"
+             "    target_volumes (dict[str, float]): Layer name to target volume (0.0 to 1.0)\n"
+             "    duration (timedelta | float): Duration of the fades; a float is seconds.\n"
+             "        Rounded to whole milliseconds; a positive duration is at least 1 ms\n\n"
+             "Raises:\n"
+             "    AudioException: If duration is zero or negative\n\n"
+             "Example:\n"
+             "    audio.fade_layers(track, {\"calm\": 0.0, \"battle\": 1.0}, timedelta(seconds=2))")
         
         // Group Operations
         .def("create_group", &AudioManager::CreateGroup,
@@ -287,12 +436,34 @@ void bind_audio_manager(py::module_& m) {
              "Raises:\n"
              "    AudioException: If group creation fails")
         
+        .def("create_groups", &AudioManager::CreateGroups,
+             py::arg("count"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Create several audio groups in one call.\n\n"
+             "Equivalent to calling create_group() count times. Either every\n"
+             "group is created or none is.\n\n"
+             "Args:\n"
+             "    count (int): Number of groups to create\n\n"
+             "Returns:\n"
+             "    list[GroupHandle]: Handles to the newly created groups\n\n"
+             "Raises:\n"
+             "    AudioException: If group creation fails")
+        
         .def("destroy_group", &AudioManager::DestroyGroup,
              py::arg("group"),
              "Destroy an audio group.\n\n"
              "Args:\n"
              "    group (GroupHandle): Handle to the group to destroy")
         
+        .def("destroy_groups", &AudioManager::DestroyGroups,
+             py::arg("groups"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Destroy several audio groups in one call.\n\n"
+             "Equivalent to calling destroy_group() for each handle. Unknown\n"
+             "handles are ignored.\n\n"
+             "Args:\n"
+             "    groups (list[GroupHandle]): Handles to the groups to destroy")
+        
         .def("set_group_volume", &AudioManager::SetGroupVolume,
              py::arg("group"),
              py::arg("volume"),
@@ -312,20 +483,28 @@ void bind_audio_manager(py::module_& m) {
              "Returns:\n"
              "    float: Current volume level (0.0 to 1.0)")
         
-        .def("fade_group", &AudioManager::FadeGroup,
+        .def("fade_group", [](AudioManager& self, GroupHandle group, float targetVolume,
+                              std::chrono::duration<double> duration) {
+                 self.FadeGroup(group, targetVolume, ToFadeDuration(duration));
+             },
              py::arg("group"),
              py::arg("target_volume"),
              py::arg("duration"),
+             py::call_guard<py::gil_scoped_release>(),
              "Fade a group's volume to a target value over time.\n\n"
              "Args:\n"
              "    group (GroupHandle): Handle to the group\n"
              "    target_volume (float): Target volume level (0.0 to 1.0)\n"
-             "    duration (timedelta): Duration of the fade")
+             "    duration (timedelta | float): Duration of the fade; a float is seconds.\n"
+             "        Rounded to whole milliseconds; a positive duration is at least 1 ms\n\n"
+             "Raises:\n"
+             "    AudioException: If duration is zero or negative")
         
         // Sound Operations
         .def("load_sound", 
              py::overload_cast<const std::string&>(&AudioManager::LoadSound),
              py::arg("filepath"),
+             py::call_guard<py::gil_scoped_release>(),
              "Load a sound from a file.\n\n"
              "Args:\n"
              "    filepath (str): Path to the audio file\n\n"
@@ -338,6 +517,7 @@ void bind_audio_manager(py::module_& m) {
              py::overload_cast<const std::string&, GroupHandle>(&AudioManager::LoadSound),
              py::arg("filepath"),
              py::arg("group"),
+             py::call_guard<py::gil_scoped_release>(),
              "Load a sound from a file and assign it to a group.\n\n"
              "Args:\n"
              "    filepath (str): Path to the audio file\n"
@@ -347,14 +527,39 @@ void bind_audio_manager(py::module_& m) {
              "Raises:\n"
              "    FileLoadException: If the file cannot be loaded")
         
+        .def("load_sounds", &AudioManager::LoadSounds,
+             py::arg("filepaths"),
+             py::arg("group") = GroupHandle::Invalid(),
+             py::call_guard<py::gil_scoped_release>(),
+             "Load several sounds in one call.\n\n"
+             "Equivalent to calling load_sound() for each path. Either every sound\n"
+             "is loaded or none is.\n\n"
+             "Args:\n"
+             "    filepaths (list[str]): Paths to the audio files\n"
+             "    group (GroupHandle, optional): Group handle to assign the sounds to\n\n"
+             "Returns:\n"
+             "    list[SoundHandle]: Handles to the loaded sounds, in the same order\n\n"
+             "Raises:\n"
+             "    FileLoadException: If any file cannot be loaded")
+        
         .def("destroy_sound", &AudioManager::DestroySound,
              py::arg("sound"),
              "Destroy a previously loaded sound.\n\n"
              "Args:\n"
              "    sound (SoundHandle): Handle to the sound to destroy")
         
+        .def("destroy_sounds", &AudioManager::DestroySounds,
+             py::arg("sounds"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Destroy several previously loaded sounds in one call.\n\n"
+             "Equivalent to calling destroy_sound() for each handle. Unknown\n"
+             "handles are ignored.\n\n"
+             "Args:\n"
+             "    sounds (list[SoundHandle]): Handles to the sounds to destroy")
+        
         .def("play_sound", py::overload_cast<SoundHandle>(&AudioManager::PlaySound),
              py::arg("sound"),
+             py::call_guard<py::gil_scoped_release>(),
              "Play a sound using its current position.\n\n"
              "Args:\n"
              "    sound (SoundHandle): Handle to the sound to play\n\n"
@@ -362,6 +567,7 @@ void bind_audio_manager(py::module_& m) {
              "    InvalidHandleException: If sound handle is invalid")
         .def("play_sound", py::overload_cast<SoundHandle, const Vec3&>(&AudioManager::PlaySound),
              py::arg("sound"), py::arg("position"),
+             py::call_guard<py::gil_scoped_release>(),
              "Play a sound at a specific position.\n\n"
              "This allows multiple overlapping spatialized sounds from the same\n"
              "audio file to play at different positions simultaneously (e.g.,\n"
@@ -379,9 +585,81 @@ void bind_audio_manager(py::module_& m) {
              "    # Play multiple gunshots at different positions\n"
              "    audio.play_sound(gunshot, game_audio.Vec3(10, 0, 0))  # Enemy 1\n"
              "    audio.play_sound(gunshot, game_audio.Vec3(20, 0, 0))  # Enemy 2")
+
+        // Registered before the list overload so buffers are not iterated element by element
+        .def("play_sound_batch", [](AudioManager& self, SoundHandle sound, py::buffer positions) {
+                 py::buffer_info info = positions.request();
+                 if (!IsNativeFloat32(info)) {
+                     throw py::type_error("positions must hold float32 data, got format '" + info.format + "'");
+                 }
+                 bool packed = info.size % 3 == 0 &&
+                               ((info.ndim == 1 && info.strides[0] == sizeof(float)) ||
+                                (info.ndim == 2 && info.shape[1] == 3 &&
+                                 info.strides[1] == sizeof(float) && info.strides[0] == 3 * sizeof(float)));
+                 if (!packed) {
+                     throw py::value_error("positions must be a contiguous buffer of shape (N, 3) or (3N,)");
+                 }
+                 const float* data = static_cast<const float*>(info.ptr);
+                 std::vector<Vec3> points(data == nullptr ? 0 : static_cast<size_t>(info.size / 3));
+                 for (size_t i = 0; i < points.size(); ++i) {
+                     points[i] = Vec3(data[3 * i], data[3 * i + 1], data[3 * i + 2]);
+                 }
+                 py::gil_scoped_release release;
+                 self.PlaySoundBatch(sound, points);
+             },
+             py::arg("sound"), py::arg("positions"),
+             "Play a sound at several positions given as packed float32 coordinates.\n\n"
+             "Accepts any buffer of x, y, z triples (e.g. array.array('f'), or a\n"
+             "float32 NumPy array of shape (N, 3)), so no Vec3 objects are needed.\n\n"
+             "Args:\n"
+             "    sound (SoundHandle): Handle to the sound to play\n"
+             "    positions (buffer): Contiguous float32 data of shape (N, 3) or (3N,)\n\n"
+             "Raises:\n"
+             "    InvalidHandleException: If sound handle is invalid\n"
+             "    TypeError: If positions does not hold native float32 data\n"
+             "    ValueError: If positions is not contiguous with shape (N, 3) or (3N,)\n\n"
+             "Example:\n"
+             "    enemies = array.array('f', [10, 0, 0, -10, 0, 0])\n"
+             "    audio.play_sound_batch(gunshot, enemies)")
         
+        .def("play_sound_batch", &AudioManager::PlaySoundBatch,
+             py::arg("sound"), py::arg("positions"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Play a sound at several positions in a single call.\n\n"
+             "Starts one playback instance per position. Equivalent to calling\n"
+             "play_sound(sound, position) in a loop, but crosses into C++ once\n"
+             "and releases the GIL while the instances are started.\n\n"
+             "Args:\n"
+             "    sound (SoundHandle): Handle to the sound to play\n"
+             "    positions (list[Vec3]): 3D positions, one per playback instance\n\n"
+             "Raises:\n"
+             "    InvalidHandleException: If sound handle is invalid\n\n"
+             "Example:\n"
+             "    enemies = [game_audio.Vec3(10, 0, 0), game_audio.Vec3(-10, 0, 0)]\n"
+             "    audio.play_sound_batch(gunshot, enemies)")
+
+        .def("schedule_play_sound", &AudioManager::SchedulePlaySound,
+             py::arg("sound"), py::arg("position"), py::arg("delay"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Schedule a sound to play at a specific position after a delay.\n\n"
+             "The playback instance is started on the audio engine's clock, so it\n"
+             "begins exactly `delay` from now without the caller sleeping. Scheduled\n"
+             "instances count as playing and can be cancelled with stop_sound().\n\n"
+             "Args:\n"
+             "    sound (SoundHandle): Handle to the sound to play\n"
+             "    position (Vec3): 3D position for this playback instance\n"
+             "    delay (timedelta | float): Delay before the sound becomes audible; a float is seconds\n\n"
+             "Raises:\n"
+             "    InvalidHandleException: If sound handle is invalid\n"
+             "    AudioException: If delay is negative\n\n"
+             "Example:\n"
+             "    # Three shots 200ms apart, queued in one go\n"
+             "    for i in range(3):\n"
+             "        audio.schedule_play_sound(gunshot, pos, timedelta(milliseconds=200 * i))")
+
         .def("stop_sound", &AudioManager::StopSound,
              py::arg("sound"),
+             py::call_guard<py::gil_scoped_release>(),
              "Stop a currently playing sound.\n\n"
              "Args:\n"
              "    sound (SoundHandle): Handle to the sound to stop\n\n"
@@ -416,14 +694,39 @@ void bind_audio_manager(py::module_& m) {
              "Raises:\n"
              "    InvalidHandleException: If sound handle is invalid")
         
+        .def("preload_sound", &AudioManager::PreloadSound,
+             py::arg("sound"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Decode a sound into memory ahead of playback.\n\n"
+             "The decoded audio stays resident until the sound is destroyed and is\n"
+             "shared by every instance, so play_sound() no longer reads the file.\n"
+             "Preloaded sounds are never streamed; use this for short effects.\n\n"
+             "Args:\n"
+             "    sound (SoundHandle): Handle to the sound\n\n"
+             "Raises:\n"
+             "    InvalidHandleException: If sound handle is invalid\n"
+             "    FileLoadException: If the file cannot be decoded")
+        
         .def("is_sound_playing", &AudioManager::IsSoundPlaying,
              py::arg("sound"),
+             py::call_guard<py::gil_scoped_release>(),
              "Check if a sound is currently playing.\n\n"
              "Args:\n"
              "    sound (SoundHandle): Handle to the sound\n\n"
              "Returns:\n"
              "    bool: True if the sound is playing, False otherwise")
         
+        .def("get_sound_instance_count", &AudioManager::GetSoundInstanceCount,
+             py::arg("sound"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Count the instances of a sound that are playing or scheduled.\n\n"
+             "Each play_sound(), play_sound_batch() position or schedule_play_sound()\n"
+             "call adds one instance until it finishes or the sound is stopped.\n\n"
+             "Args:\n"
+             "    sound (SoundHandle): Handle to the sound\n\n"
+             "Returns:\n"
+             "    int: Number of live instances, or 0 if the handle is invalid")
+        
         .def("play_random_sound_from_folder", &AudioManager::PlayRandomSoundFromFolder,
              py::arg("folder_path"),
              py::arg("group") = GroupHandle::Invalid(),
@@ -438,6 +741,7 @@ void bind_audio_manager(py::module_& m) {
         .def("set_listener_position", &AudioManager::SetListenerPosition,
              py::arg("position"),
              py::arg("listener_index") = 0,
+             py::call_guard<py::gil_scoped_release>(),
              "Set the listener position in 3D space.\n\n"
              "The listener represents the 'ears' of the player/camera.\n"
              "All spatialized sounds are positioned relative to the listener.\n\n"
@@ -492,6 +796,7 @@ void bind_audio_manager(py::module_& m) {
         .def("set_sound_position", &AudioManager::SetSoundPosition,
              py::arg("sound"),
              py::arg("position"),
+             py::call_guard<py::gil_scoped_release>(),
              "Set the 3D position of a sound.\n\n"
              "Sets the position for the sound. The sound will be spatialized\n"
              "relative to the listener position.\n\n"
@@ -576,6 +881,25 @@ void bind_audio_manager(py::module_& m) {
              "Raises:\n"
              "    InvalidHandleException: If sound handle is invalid")
         
+        .def("configure_sound_spatial", &AudioManager::ConfigureSoundSpatial,
+             py::arg("sound"),
+             py::arg("min_distance"),
+             py::arg("max_distance"),
+             py::arg("rolloff"),
+             py::arg("position") = py::none(),
+             py::call_guard<py::gil_scoped_release>(),
+             "Set a sound's distance attenuation, and optionally its position, in one call.\n\n"
+             "Equivalent to set_sound_min_distance(), set_sound_max_distance(),\n"
+             "set_sound_rolloff() and set_sound_position(), with a single handle lookup.\n\n"
+             "Args:\n"
+             "    sound (SoundHandle): Handle to the sound\n"
+             "    min_distance (float): Minimum distance (must be > 0)\n"
+             "    max_distance (float): Maximum distance (must be > min_distance)\n"
+             "    rolloff (float): Rolloff factor (typically 1.0 to 2.0)\n"
+             "    position (Vec3, optional): 3D position; unchanged if omitted\n\n"
+             "Raises:\n"
+             "    InvalidHandleException: If sound handle is invalid")
+        
         .def("set_sound_spatialization_enabled", &AudioManager::SetSoundSpatializationEnabled,
              py::arg("sound"),
              py::arg("enabled"),
@@ -21,7 +21,13 @@ void bind_random_sound_container(py::module_& m) {
         .def_readwrite("group", &RandomSoundContainerConfig::group,
                       "GroupHandle: Audio group handle to assign sounds to")
         .def_readwrite("max_duration", &RandomSoundContainerConfig::maxDuration,
-                      "float: Maximum duration in seconds (0 = no limit)");
+                      "float: Maximum duration in seconds (0 = no limit)")
+        .def_readwrite("min_distance", &RandomSoundContainerConfig::minDistance,
+                      "float: Spatial min distance applied to each loaded sound")
+        .def_readwrite("max_distance", &RandomSoundContainerConfig::maxDistance,
+                      "float: Spatial max distance applied to each loaded sound")
+        .def_readwrite("rolloff", &RandomSoundContainerConfig::rolloff,
+                      "float: Spatial rolloff factor applied to each loaded sound");
     
     // Bind the container class
     py::class_<RandomSoundContainer>(m, "RandomSoundContainer",
@@ -48,9 +54,15 @@ void bind_random_sound_container(py::module_& m) {
         
         .def("load_from_folder", &RandomSoundContainer::LoadFromFolder,
              py::arg("folder_path"),
+             // Keeps the GIL: the container's sound list is unsynchronized, so
+             // other threads must not reach play()/add_sound() mid-load
              "Load all .wav files from a folder.\n\n"
+             "Files that cannot be opened or decoded are skipped and the rest are\n"
+             "still added, after which FileLoadException names the skipped files.\n\n"
              "Args:\n"
-             "    folder_path (str): Path to the folder containing sound files")
+             "    folder_path (str): Path to the folder containing sound files\n\n"
+             "Raises:\n"
+             "    FileLoadException: If any .wav file in the folder cannot be loaded")
         
         // Playback
         .def("play", &RandomSoundContainer::Play,
@@ -106,5 +118,13 @@ void bind_random_sound_container(py::module_& m) {
         .def("get_sound_count", &RandomSoundContainer::GetSoundCount,
              "Get the number of sounds in this container.\n\n"
              "Returns:\n"
-             "    int: Number of loaded sounds");
+             "    int: Number of loaded sounds")
+        
+        .def("get_sounds", &RandomSoundContainer::GetSounds,
+             "Get the handles of every sound in this container.\n\n"
+             "The handles remain owned by the container and are destroyed with it.\n"
+             "Useful for configuring every variant at once, or for picking\n"
+             "variants on the Python side without a call per selection.\n\n"
+             "Returns:\n"
+             "    list[SoundHandle]: Loaded sound handles, in load order");
 }
@@ -15,12 +15,17 @@ playback instances.
 import os
 import sys
 import time
+from datetime import timedelta
+from pathlib import Path
 
 import game_audio
 
 # Sound directory
 SOUND_DIR = os.path.join(os.path.dirname(__file__), '..', 'sound_files')
 
+# Available sound files by stem (e.g. "hit"), resolved once with a single directory scan
+SOUND_FILES = {p.stem: str(p) for p in Path(SOUND_DIR).glob("*.wav")}
+
 def main():
     """Main function - demonstrate overlapping spatial sounds"""
     print("=== Overlapping Spatial Sounds Example ===")
@@ -37,9 +42,9 @@ def main():
     
     # Load a short sound effect (gunshot, explosion, etc.)
     # Using a short sound file for demonstration
-    sound_file = os.path.join(SOUND_DIR, "hit.wav")
-    if not os.path.exists(sound_file):
-        print(f"Error: Sound file not found: {sound_file}")
+    sound_file = SOUND_FILES.get("hit")
+    if sound_file is None:
+        print(f"Error: Sound file not found: {os.path.join(SOUND_DIR, 'hit.wav')}")
         print("Please ensure sound files are available in the sound_files directory.")
         return
     
@@ -47,9 +52,7 @@ def main():
     gunshot_sound = audio.load_sound(sound_file, sfx_group)
     
     # Configure spatial audio parameters
-    audio.set_sound_min_distance(gunshot_sound, 1.0)
-    audio.set_sound_max_distance(gunshot_sound, 50.0)
-    audio.set_sound_rolloff(gunshot_sound, 1.0)
+    audio.configure_sound_spatial(gunshot_sound, min_distance=1.0, max_distance=50.0, rolloff=1.0)
     
     # Set up listener at origin
     listener_position = game_audio.Vec3(0.0, 0.0, 0.0)
@@ -70,10 +73,10 @@ def main():
     ]
     
     print("Playing gunshots at different positions...")
-    for i, pos in enumerate(enemy_positions, 1):
-        print(f"  Enemy {i} shoots at position {pos}")
-        audio.play_sound(gunshot_sound, pos)
-        time.sleep(0.1)  # Small delay to hear each one
+    # One call starts every instance; avoids a binding round-trip per enemy
+    audio.play_sound_batch(gunshot_sound, enemy_positions)
+    print("\n".join(f"  Enemy {i} shoots at position {pos}"
+                    for i, pos in enumerate(enemy_positions, 1)))
     
     print("\nAll gunshots are now playing simultaneously at different positions!")
     print("Notice how each one maintains its own position even though")
@@ -87,12 +90,19 @@ def main():
     print("\n=== Scenario: Rapid Fire from Same Position ===")
     print("Playing multiple gunshots rapidly from the same position...")
     rapid_fire_pos = game_audio.Vec3(10.0, 0.0, 0.0)
+    already_playing = audio.get_sound_instance_count(gunshot_sound)
     for i in range(5):
-        print(f"  Shot {i+1} at {rapid_fire_pos}")
-        audio.play_sound(gunshot_sound, rapid_fire_pos)
-        time.sleep(0.2)
+        # Queue each shot on the audio clock instead of sleeping between calls
+        audio.schedule_play_sound(gunshot_sound, rapid_fire_pos, timedelta(milliseconds=200 * i))
+    # Report after queuing so console output doesn't delay the later shots
+    print("\n".join(f"  Shot {i+1} at {rapid_fire_pos} after {200 * i} ms" for i in range(5)))
+    
+    # Pending shots count as instances, so every queued shot should be here
+    queued = audio.get_sound_instance_count(gunshot_sound) - already_playing
+    if queued != 5:
+        print(f"\nWarning: only {queued} of 5 shots are queued!")
     
-    print("\nAll shots are playing simultaneously at the same position!")
+    print("\nThe shots start 200 ms apart at the same position and overlap!")
     print("Each shot maintains its own playback instance.\n")
     
     # Wait for sounds to finish
@@ -102,6 +112,7 @@ def main():
     print("\n=== Key Points ===")
     print("1. Load the sound file ONCE (e.g., at game start)")
     print("2. Use play_sound(sound, position) to play at specific positions")
+    print("   (or play_sound_batch(sound, positions) for a whole volley at once)")
     print("3. Each call creates a new playback instance with its own position")
     print("4. Existing instances keep their positions unchanged")
     print("5. Finished instances are automatically cleaned up")
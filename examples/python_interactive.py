@@ -17,7 +17,8 @@ Commands:
 import sys
 import os
 import random
-from datetime import timedelta
+from collections import namedtuple
+from pathlib import Path
 
 # Add build directory to path to find the game_audio module
 build_dir = os.path.join(os.path.dirname(__file__), '..', 'build', 'Debug')
@@ -29,11 +30,30 @@ import game_audio
 # Sound directory
 SOUND_DIR = os.path.join(os.path.dirname(__file__), '..', 'sound_files')
 
+# Available sound files by stem (e.g. "touch_1"), resolved once with a single directory scan
+SOUND_FILES = {p.stem: str(p) for p in Path(SOUND_DIR).glob("*.wav")}
+
+# Crossfade duration shared by all music transitions, in seconds
+# (fade durations accept a float in seconds or a timedelta)
+FADE_TIME = 2.0
+
+# Music layers, named "<mode>_<intensity>"
+MUSIC_LAYERS = ("digital_base", "digital_battle", "strings_base", "strings_battle")
+
 # State variables
 digital_mode = True
 battle = False
 music_on = True
 
+def music_state_volumes():
+    """Target volume for every music layer given the current mode and battle state"""
+    active = f"{'digital' if digital_mode else 'strings'}_{'battle' if battle else 'base'}"
+    return {layer: 1.0 if layer == active else 0.0 for layer in MUSIC_LAYERS}
+
+# Everything the command handlers need from setup_audio()
+AudioContext = namedtuple("AudioContext", ["session", "audio", "music_track", "music_group",
+                                           "sfx_group", "touch_sounds", "hit_sfx"])
+
 def setup_audio():
     """Initialize the audio system and create the layered music track"""
     print("Initializing audio system...")
@@ -58,135 +78,97 @@ def setup_audio():
     
     # Add layers
     print("Adding layers to music track...")
-    audio.add_layer(music_track, "digital_base",
-                   os.path.join(SOUND_DIR, "digital_base.wav"), music_group)
-    audio.add_layer(music_track, "digital_battle",
-                   os.path.join(SOUND_DIR, "digital_battle.wav"), music_group)
-    audio.add_layer(music_track, "strings_base",
-                   os.path.join(SOUND_DIR, "strings_base.wav"), music_group)
-    audio.add_layer(music_track, "strings_battle",
-                   os.path.join(SOUND_DIR, "strings_battle.wav"), music_group)
+    for layer in MUSIC_LAYERS:
+        audio.add_layer(music_track, layer, SOUND_FILES[layer], music_group)
     
     print("Setting initial layer volumes...")
     # Start with digital base
-    audio.set_layer_volume(music_track, "digital_base", 1.0)
-    audio.set_layer_volume(music_track, "digital_battle", 0.0)
-    audio.set_layer_volume(music_track, "strings_base", 0.0)
-    audio.set_layer_volume(music_track, "strings_battle", 0.0)
+    for layer, volume in music_state_volumes().items():
+        audio.set_layer_volume(music_track, layer, volume)
     
     # Start playing
     print("Starting playback...")
     audio.play_track(music_track)
     
     # Load sound effects
-    touch_sounds = []
-    for i in range(1, 9):
-        sfx_path = os.path.join(SOUND_DIR, f"touch_{i}.wav")
-        if os.path.exists(sfx_path):
-            touch_sounds.append(audio.load_sound(sfx_path, sfx_group))
+    touch_sounds = audio.load_sounds([SOUND_FILES[f"touch_{i}"] for i in range(1, 9)
+                                      if f"touch_{i}" in SOUND_FILES], sfx_group)
     
-    hit_sfx = audio.load_sound(os.path.join(SOUND_DIR, "hit.wav"), sfx_group)
+    hit_sfx = audio.load_sound(SOUND_FILES["hit"], sfx_group)
     
-    return session, audio, music_track, music_group, sfx_group, touch_sounds, hit_sfx
-
-def process_input(command, audio, music_track, music_group, sfx_group, touch_sounds, hit_sfx):
-    """Process user input commands"""
-    global digital_mode, battle, music_on
+    # Short effects are decoded once up front instead of streamed per play
+    for sfx in touch_sounds + [hit_sfx]:
+        audio.preload_sound(sfx)
     
+    return AudioContext(session, audio, music_track, music_group, sfx_group, touch_sounds, hit_sfx)
+
+def _volume_command(label, apply):
+    """Build a handler that parses a volume argument and passes it to apply(ctx, volume)"""
+    def handler(args, ctx):
+        try:
+            volume = float(args[0])
+        except (IndexError, ValueError):
+            print("Invalid volume value")
+            return
+        apply(ctx, volume)
+        print(f"{label} volume set to {volume}")
+    return handler
+
+def play_random_sfx(args, ctx):
+    """Play a random touch sound, or the hit sound if none were found"""
+    if ctx.touch_sounds:
+        ctx.audio.play_sound(random.choice(ctx.touch_sounds))
+        print("Playing random touch sound")
+    else:
+        ctx.audio.play_sound(ctx.hit_sfx)
+        print("Playing hit sound")
+
+def toggle_music(args, ctx):
+    """Fade the music group in or out"""
+    global music_on
+    music_on = not music_on
+    target = 0.7 if music_on else 0.0
+    ctx.audio.fade_group(ctx.music_group, target, FADE_TIME)
+    print(f"Music {'ON' if music_on else 'OFF'}")
+
+def toggle_music_type(args, ctx):
+    """Crossfade between the digital and strings layers"""
+    global digital_mode
+    digital_mode = not digital_mode
+    print(f"Switching to {'DIGITAL' if digital_mode else 'STRINGS'} mode")
+    ctx.audio.fade_layers(ctx.music_track, music_state_volumes(), FADE_TIME)
+
+def toggle_battle(args, ctx):
+    """Crossfade between the calm and battle layers"""
+    global battle
+    battle = not battle
+    print(f"Battle mode: {'INTENSE' if battle else 'CALM'}")
+    ctx.audio.fade_layers(ctx.music_track, music_state_volumes(), FADE_TIME)
+
+# Command letter -> handler(args, ctx); built once at import
+COMMANDS = {
+    'v': _volume_command("Master", lambda ctx, v: ctx.audio.set_master_volume(v)),
+    'm': _volume_command("Music", lambda ctx, v: ctx.audio.set_group_volume(ctx.music_group, v)),
+    's': _volume_command("SFX", lambda ctx, v: ctx.audio.set_group_volume(ctx.sfx_group, v)),
+    'x': play_random_sfx,
+    'o': toggle_music,
+    't': toggle_music_type,
+    'b': toggle_battle,
+}
+
+def process_input(command, ctx):
+    """Process user input commands; returns False when the user quits"""
     parts = command.strip().split()
     if not parts:
         return True
     
     cmd = parts[0].lower()
-    
-    # Set master volume
-    if cmd == 'v' and len(parts) > 1:
-        try:
-            volume = float(parts[1])
-            audio.set_master_volume(volume)
-            print(f"Master volume set to {volume}")
-        except ValueError:
-            print("Invalid volume value")
-    
-    # Set music volume
-    elif cmd == 'm' and len(parts) > 1:
-        try:
-            volume = float(parts[1])
-            audio.set_group_volume(music_group, volume)
-            print(f"Music volume set to {volume}")
-        except ValueError:
-            print("Invalid volume value")
-    
-    # Set SFX volume
-    elif cmd == 's' and len(parts) > 1:
-        try:
-            volume = float(parts[1])
-            audio.set_group_volume(sfx_group, volume)
-            print(f"SFX volume set to {volume}")
-        except ValueError:
-            print("Invalid volume value")
-    
-    # Play random sound effect
-    elif cmd == 'x':
-        if touch_sounds:
-            sfx = random.choice(touch_sounds)
-            audio.play_sound(sfx)
-            print("Playing random touch sound")
-        else:
-            audio.play_sound(hit_sfx)
-            print("Playing hit sound")
-    
-    # Toggle music on/off
-    elif cmd == 'o':
-        music_on = not music_on
-        target = 0.7 if music_on else 0.0
-        audio.fade_group(music_group, target, timedelta(seconds=2))
-        print(f"Music {'ON' if music_on else 'OFF'}")
-    
-    # Toggle music type (digital/strings)
-    elif cmd == 't':
-        digital_mode = not digital_mode
-        print(f"Switching to {'DIGITAL' if digital_mode else 'STRINGS'} mode")
-        
-        if digital_mode:
-            # Fade in digital layers
-            base_layer = "digital_battle" if battle else "digital_base"
-            audio.fade_layer(music_track, base_layer, 1.0, timedelta(seconds=2))
-            # Fade out strings layers
-            audio.fade_layer(music_track, "strings_base", 0.0, timedelta(seconds=2))
-            audio.fade_layer(music_track, "strings_battle", 0.0, timedelta(seconds=2))
-        else:
-            # Fade in strings layers
-            base_layer = "strings_battle" if battle else "strings_base"
-            audio.fade_layer(music_track, base_layer, 1.0, timedelta(seconds=2))
-            # Fade out digital layers
-            audio.fade_layer(music_track, "digital_base", 0.0, timedelta(seconds=2))
-            audio.fade_layer(music_track, "digital_battle", 0.0, timedelta(seconds=2))
-    
-    # Toggle battle mode
-    elif cmd == 'b':
-        battle = not battle
-        print(f"Battle mode: {'INTENSE' if battle else 'CALM'}")
-        
-        if digital_mode:
-            if battle:
-                audio.fade_layer(music_track, "digital_base", 0.0, timedelta(seconds=2))
-                audio.fade_layer(music_track, "digital_battle", 1.0, timedelta(seconds=2))
-            else:
-                audio.fade_layer(music_track, "digital_battle", 0.0, timedelta(seconds=2))
-                audio.fade_layer(music_track, "digital_base", 1.0, timedelta(seconds=2))
-        else:
-            if battle:
-                audio.fade_layer(music_track, "strings_base", 0.0, timedelta(seconds=2))
-                audio.fade_layer(music_track, "strings_battle", 1.0, timedelta(seconds=2))
-            else:
-                audio.fade_layer(music_track, "strings_battle", 0.0, timedelta(seconds=2))
-                audio.fade_layer(music_track, "strings_base", 1.0, timedelta(seconds=2))
-    
-    # Quit
-    elif cmd == 'q':
+    if cmd == 'q':
         return False
     
+    handler = COMMANDS.get(cmd)
+    if handler:
+        handler(parts[1:], ctx)
     else:
         print("Unknown command")
     
@@ -198,7 +180,7 @@ def main():
     print(f"Sound directory: {SOUND_DIR}\n")
     
     # Setup audio system
-    session, audio, music_track, music_group, sfx_group, touch_sounds, hit_sfx = setup_audio()
+    ctx = setup_audio()
     
     # Print commands
     print("\n=== Interactive Audio Test ===")
@@ -218,15 +200,14 @@ def main():
     while running:
         try:
             command = input("> ")
-            running = process_input(command, audio, music_track, music_group, 
-                                   sfx_group, touch_sounds, hit_sfx)
+            running = process_input(command, ctx)
         except (EOFError, KeyboardInterrupt):
             print("\nExiting...")
             break
     
     # Cleanup
     print("Shutting down audio system...")
-    session.close()
+    ctx.session.close()
     print("Done!")
 
 if __name__ == "__main__":
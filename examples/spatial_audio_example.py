@@ -11,14 +11,20 @@ Usage:
 Controls:
     w/s - Move listener forward/backward
     a/d - Move listener left/right
-    q/e - Move listener up/down
+    u/j - Move listener up/down
     p   - Play sound at fixed position
     r   - Reset listener position
     q   - Quit
+
+Keys take effect immediately (no Enter needed) when run in a terminal.
+Several keys typed at once are applied together as one listener update.
 """
 
 import sys
 import os
+import random
+from collections import deque
+from pathlib import Path
 
 # Add build directory to path to find the game_audio module
 build_dir = os.path.join(os.path.dirname(__file__), '..', 'build', 'Debug')
@@ -30,6 +36,58 @@ import game_audio
 # Sound directory
 SOUND_DIR = os.path.join(os.path.dirname(__file__), '..', 'sound_files')
 
+# Available sound files by stem (e.g. "touch_1"), resolved once with a single directory scan
+SOUND_FILES = {p.stem: str(p) for p in Path(SOUND_DIR).glob("*.wav")}
+
+# Per-move status lines are only useful to someone watching a terminal;
+# skip formatting them when output is redirected (e.g. scripted runs)
+VERBOSE = sys.stdout.isatty()
+
+# Movement keys -> (listener axis, direction); forward is negative Z
+MOVES = {
+    'w': ('z', -1),  # Forward
+    's': ('z', +1),  # Backward
+    'a': ('x', -1),  # Left
+    'd': ('x', +1),  # Right
+    'u': ('y', +1),  # Up
+    'j': ('y', -1),  # Down
+}
+
+# Half-extent of the box random touch sounds are placed in, per axis (x, y, z)
+TOUCH_RANGE = (10.0, 5.0, 10.0)
+
+def read_keys():
+    """Wait for a keypress and return it with any other keys already typed.
+    
+    Uses msvcrt on Windows and cbreak mode elsewhere; falls back to a
+    line-based prompt when stdin is not a terminal (e.g. piped input), in
+    which case the whole line is returned as one command.
+    Audio keeps updating on the engine's own thread while this blocks.
+    """
+    if not sys.stdin.isatty():
+        return [input("> ")]
+    if os.name == 'nt':
+        import msvcrt
+        keys = [msvcrt.getwch()]
+        while msvcrt.kbhit():
+            keys.append(msvcrt.getwch())
+        if '\x03' in keys:
+            raise KeyboardInterrupt
+        return keys
+    import termios
+    import tty
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        # Blocks for the first key, then returns everything already buffered
+        data = os.read(fd, 64)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    if not data:
+        raise EOFError
+    return list(data.decode(errors='ignore'))
+
 def main():
     """Main function - setup and run spatial audio demo"""
     print("=== Spatial Audio Example ===")
@@ -48,9 +106,9 @@ def main():
     audio.set_group_volume(sfx_group, 1.0)
     
     # Load a looping music file for continuous spatial audio (in music group)
-    sound_file = os.path.join(SOUND_DIR, "clarinet.wav")
-    if not os.path.exists(sound_file):
-        print(f"Error: Sound file not found: {sound_file}")
+    sound_file = SOUND_FILES.get("clarinet")
+    if sound_file is None:
+        print(f"Error: Sound file not found: {os.path.join(SOUND_DIR, 'clarinet.wav')}")
         print("Please ensure sound files are available in the sound_files directory.")
         return
     
@@ -60,15 +118,12 @@ def main():
     # Configure spatial audio for the sound
     # Position the sound at (5, 0, 0) - 5 units to the right
     sound_position = game_audio.Vec3(5.0, 0.0, 0.0)
-    audio.set_sound_position(sound, sound_position)
-    
-    # Set distance attenuation parameters
+    # Set distance attenuation parameters and position in one call
     # min_distance: sound is at full volume within 1 unit
     # max_distance: sound fades to silence beyond 20 units
     # rolloff: 1.0 = linear falloff, 2.0 = inverse square (more realistic)
-    audio.set_sound_min_distance(sound, 1.0)
-    audio.set_sound_max_distance(sound, 20.0)
-    audio.set_sound_rolloff(sound, 1.0)  # Linear falloff
+    audio.configure_sound_spatial(sound, min_distance=1.0, max_distance=20.0, rolloff=1.0,
+                                  position=sound_position)
     
     print("\nSound configured at position:", sound_position)
     print("Min distance: 1.0, Max distance: 20.0, Rolloff: 1.0")
@@ -98,31 +153,33 @@ def main():
     print("\nLoading random sound container (touch_1.wav through touch_8.wav)...")
     touch_config = game_audio.RandomSoundContainerConfig()
     touch_config.group = sfx_group
+    # Spatial settings are applied once to each sound as it is loaded
+    touch_config.min_distance = 1.0
+    touch_config.max_distance = 30.0
+    touch_config.rolloff = 1.0
     touch_container = game_audio.RandomSoundContainer("touch_sounds", touch_config)
     
     # Add touch sounds manually (touch_1.wav through touch_8.wav)
-    touch_sounds_loaded = 0
     for i in range(1, 9):
-        touch_file = os.path.join(SOUND_DIR, f"touch_{i}.wav")
-        if os.path.exists(touch_file):
+        touch_file = SOUND_FILES.get(f"touch_{i}")
+        if touch_file:
             touch_container.add_sound(touch_file)
-            touch_sounds_loaded += 1
+    
+    # Snapshot the handles once so 'x' can pick one without calling into the container
+    touch_sounds = touch_container.get_sounds()
+    touch_sounds_loaded = len(touch_sounds)
     
     if touch_sounds_loaded == 0:
         print("Warning: No touch sound files found (touch_1.wav through touch_8.wav)")
         print("The 'x' command will not work without these files.")
     else:
         print(f"Loaded {touch_sounds_loaded} touch sound(s)")
-        # Configure spatial audio for touch sounds
-        # We'll configure each sound when we play it, but set defaults
-        # Note: We can't configure all sounds in the container at once,
-        # but we can configure them individually when we get a random one
     
     # Print instructions
     print("\n=== Controls ===")
     print("w/s - Move listener forward/backward (Z axis)")
     print("a/d - Move listener left/right (X axis)")
-    print("q/e - Move listener up/down (Y axis)")
+    print("u/j - Move listener up/down (Y axis)")
     print("p   - Restart sound playback")
     print("r   - Reset listener position to origin")
     print("x   - Play random touch sound at random position (demonstrates overlapping spatial sounds)")
@@ -132,94 +189,76 @@ def main():
     # Movement speed
     move_speed = 0.5
     
+    # Bind the per-keypress calls once; listener_position is only ever mutated
+    # in place, so the bound distance method stays valid
+    set_listener_position = audio.set_listener_position
+    listener_distance = listener_position.distance
+    
+    # Reused for every 'x' press; play_sound copies the position it is given
+    random_pos = game_audio.Vec3()
+    
+    # Keys typed faster than the loop runs are handled as one batch; a run of
+    # moves within a batch is pushed to the engine with a single listener update
+    pending = deque()
+    moved = False
+    
     # Main loop
     running = True
     while running:
         try:
-            command = input("> ").strip().lower()
-            
-            if not command:
+            if not pending:
+                if moved:
+                    set_listener_position(listener_position)
+                    if VERBOSE:
+                        distance = listener_distance(sound_position)
+                        print(f"Listener position: {listener_position}, Distance to sound: {distance:.2f}")
+                    moved = False
+                pending.extend(read_keys())
                 continue
             
-            if command == 'w':
-                # Move forward (negative Z)
-                listener_position.z -= move_speed
-                audio.set_listener_position(listener_position)
-                distance = listener_position.distance(sound_position)
-                print(f"Listener position: {listener_position}, Distance to sound: {distance:.2f}")
-            
-            elif command == 's':
-                # Move backward (positive Z)
-                listener_position.z += move_speed
-                audio.set_listener_position(listener_position)
-                distance = listener_position.distance(sound_position)
-                print(f"Listener position: {listener_position}, Distance to sound: {distance:.2f}")
+            command = pending.popleft().strip().lower()
             
-            elif command == 'a':
-                # Move left (negative X)
-                listener_position.x -= move_speed
-                audio.set_listener_position(listener_position)
-                distance = listener_position.distance(sound_position)
-                print(f"Listener position: {listener_position}, Distance to sound: {distance:.2f}")
+            if not command:
+                continue
             
-            elif command == 'd':
-                # Move right (positive X)
-                listener_position.x += move_speed
-                audio.set_listener_position(listener_position)
-                distance = listener_position.distance(sound_position)
-                print(f"Listener position: {listener_position}, Distance to sound: {distance:.2f}")
+            # Other commands play sounds or report the listener's distance,
+            # so movement earlier in the batch must reach the engine first
+            if moved and command not in MOVES:
+                set_listener_position(listener_position)
+                moved = False
             
-            elif command == 'q':
-                # Move up (positive Y)
-                listener_position.y += move_speed
-                audio.set_listener_position(listener_position)
-                distance = listener_position.distance(sound_position)
-                print(f"Listener position: {listener_position}, Distance to sound: {distance:.2f}")
-            
-            elif command == 'e':
-                # Move down (negative Y)
-                listener_position.y -= move_speed
-                audio.set_listener_position(listener_position)
-                distance = listener_position.distance(sound_position)
-                print(f"Listener position: {listener_position}, Distance to sound: {distance:.2f}")
+            if command in MOVES:
+                axis, sign = MOVES[command]
+                setattr(listener_position, axis, getattr(listener_position, axis) + sign * move_speed)
+                moved = True
             
             elif command == 'p':
                 # Restart the sound playback
                 audio.play_sound(sound)
-                distance = listener_position.distance(sound_position)
+                distance = listener_distance(sound_position)
                 print(f"Restarting sound at position {sound_position}")
                 print(f"Listener distance: {distance:.2f} units")
             
             elif command == 'r':
-                # Reset listener position
-                listener_position = game_audio.Vec3(0.0, 0.0, 0.0)
-                audio.set_listener_position(listener_position)
-                distance = listener_position.distance(sound_position)
+                # Reset listener position in place (keeps the one Vec3 we mutate)
+                listener_position.x = listener_position.y = listener_position.z = 0.0
+                set_listener_position(listener_position)
+                distance = listener_distance(sound_position)
                 print(f"Listener reset to origin, Distance to sound: {distance:.2f}")
             
             elif command == 'x':
                 # Play random touch sound at random position
                 if touch_sounds_loaded > 0:
-                    import random
-                    # Get a random sound from the container
-                    random_sound = touch_container.get_random_sound()
-                    
-                    # Generate a random position within a reasonable range
-                    random_pos = game_audio.Vec3(
-                        random.uniform(-10.0, 10.0),
-                        random.uniform(-5.0, 5.0),
-                        random.uniform(-10.0, 10.0)
-                    )
+                    # Pick a random sound from the container's handles
+                    random_sound = random.choice(touch_sounds)
                     
-                    # Configure spatial audio for this sound (if not already configured)
-                    audio.set_sound_min_distance(random_sound, 1.0)
-                    audio.set_sound_max_distance(random_sound, 30.0)
-                    audio.set_sound_rolloff(random_sound, 1.0)
+                    # Pick a random position within a reasonable range
+                    random_pos.x, random_pos.y, random_pos.z = (random.uniform(-r, r) for r in TOUCH_RANGE)
                     
                     # Play at the random position (this demonstrates overlapping spatial sounds)
                     audio.play_sound(random_sound, random_pos)
                     
-                    distance = listener_position.distance(random_pos)
+                    distance = listener_distance(random_pos)
                     print(f"Playing touch sound at random position: {random_pos}")
                     print(f"Distance from listener: {distance:.2f} units")
                     print("(This sound can overlap with previous touch sounds!)")
@@ -231,7 +270,7 @@ def main():
                 running = False
             
             else:
-                print("Unknown command. Use w/s/a/d/q/e/p/r/x")
+                print("Unknown command. Use w/s/a/d/u/j/p/r/x/q")
         
         except (EOFError, KeyboardInterrupt):
             print("\nExiting...")
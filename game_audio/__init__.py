@@ -29,42 +29,9 @@ __version__ = "2.1.0"
 # Python's import system automatically handles platform-specific suffixes
 # (e.g., game_audio.cp311-win_amd64.pyd on Windows, game_audio.cp310-x86_64-linux-gnu.so on Linux)
 try:
-    # Import the compiled extension module
-    # Python's import system automatically handles platform-specific suffixes
-    # The extension module is created by pybind11 and named 'game_audio'
-    # It should be in the same directory as this __init__.py
-    import sys
-    import os
-    import importlib.util
-    
-    # Get the directory containing this __init__.py
-    package_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Find and load the extension file directly (it has platform-specific suffix)
-    extension_file = None
-    if os.path.exists(package_dir):
-        for file in os.listdir(package_dir):
-            # Look for the extension file with platform-specific suffix
-            if file.startswith('game_audio.') and (file.endswith('.pyd') or file.endswith('.so') or file.endswith('.dylib')):
-                extension_file = os.path.join(package_dir, file)
-                break
-    
-    if extension_file and os.path.exists(extension_file):
-        # Load the extension file directly using importlib
-        # The module name must match what pybind11 exported (PyInit_game_audio)
-        spec = importlib.util.spec_from_file_location('game_audio.game_audio', extension_file)
-        if spec and spec.loader:
-            ext_module = importlib.util.module_from_spec(spec)
-            # Store in sys.modules to avoid re-loading and prevent circular imports
-            sys.modules['game_audio.game_audio'] = ext_module
-            spec.loader.exec_module(ext_module)
-        else:
-            raise ImportError(f"Could not load extension from {extension_file}")
-    else:
-        # Extension file not found - try standard import as fallback
-        # This will work if Python's import system can find it automatically
-        import importlib
-        ext_module = importlib.import_module('game_audio.game_audio')
+    # The extension module is created by pybind11 and named 'game_audio'; it is
+    # installed next to this __init__.py, so the regular import system finds it
+    from . import game_audio as ext_module
     
     # Import all public symbols from the extension module into this package's namespace
     for name in dir(ext_module):
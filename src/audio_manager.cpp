@@ -179,6 +179,10 @@ LogLevel AudioManager::GetLogLevel() {
     return Logger::GetLevel();
 }
 
+LogLevel AudioManager::SwapLogLevel(LogLevel level) {
+    return Logger::ExchangeLevel(level);
+}
+
 float AudioManager::GetMasterVolume() const {
     EnsureInitialized();
     lock_guard<mutex> lock(resource_mutex_);
@@ -200,6 +204,21 @@ TrackHandle AudioManager::CreateTrack() {
     return handle;
 }
 
+std::vector<TrackHandle> AudioManager::CreateTracks(size_t count) {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    
+    std::vector<TrackHandle> handles;
+    handles.reserve(count);
+    for (size_t i = 0; i < count; ++i) {
+        TrackHandle handle = NextTrackHandle();
+        tracks_[handle] = AudioTrack::Create(audio_system_.get());
+        handles.push_back(handle);
+    }
+    
+    return handles;
+}
+
 void AudioManager::DestroyTrack(TrackHandle track) {
     EnsureInitialized();
     lock_guard<mutex> lock(resource_mutex_);
@@ -209,6 +228,14 @@ void AudioManager::DestroyTrack(TrackHandle track) {
     }
 }
 
+void AudioManager::DestroyTracks(const std::vector<TrackHandle>& tracks) {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    for (TrackHandle track : tracks) {
+        tracks_.erase(track);
+    }
+}
+
 void AudioManager::PlayTrack(TrackHandle track) {
     EnsureInitialized();
     lock_guard<mutex> lock(resource_mutex_);
@@ -282,6 +309,17 @@ void AudioManager::SetLayerVolume(TrackHandle track, const string& layerName, fl
     track_it->second->SetLayerVolume(layerName, volume);
 }
 
+float AudioManager::GetLayerVolume(TrackHandle track, const string& layerName) const {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    auto track_it = tracks_.find(track);
+    if (track_it == tracks_.end() || !track_it->second) {
+        throw InvalidHandleException("Invalid track handle: " + std::to_string(track.Value()));
+    }
+    
+    return track_it->second->GetLayerVolume(layerName);
+}
+
 void AudioManager::FadeLayer(TrackHandle track, const string& layerName, 
                             float targetVolume, std::chrono::milliseconds duration) {
     EnsureInitialized();
@@ -295,6 +333,21 @@ void AudioManager::FadeLayer(TrackHandle track, const string& layerName,
     track_it->second->FadeLayer(layerName, targetVolume, duration);
 }
 
+void AudioManager::FadeLayers(TrackHandle track, const unordered_map<string, float>& targetVolumes,
+                             std::chrono::milliseconds duration) {
+    EnsureInitialized();
+    if (duration.count() <= 0) {
+        throw AudioException("Fade duration must be positive");
+    }
+    lock_guard<mutex> lock(resource_mutex_);
+    auto track_it = tracks_.find(track);
+    if (track_it == tracks_.end() || !track_it->second) return;
+    
+    for (const auto& [layerName, targetVolume] : targetVolumes) {
+        track_it->second->FadeLayer(layerName, targetVolume, duration);
+    }
+}
+
 // Group operations
 GroupHandle AudioManager::CreateGroup() {
     EnsureInitialized();
@@ -315,6 +368,32 @@ GroupHandle AudioManager::CreateGroup() {
     return handle;
 }
 
+std::vector<GroupHandle> AudioManager::CreateGroups(size_t count) {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    
+    // Create every group before registering any, so a failure leaves no partial batch
+    std::vector<unique_ptr<AudioGroup>> created;
+    created.reserve(count);
+    for (size_t i = 0; i < count; ++i) {
+        auto group = audio_system_->CreateGroup();
+        if (!group) {
+            throw AudioException("Failed to create audio group");
+        }
+        created.push_back(std::move(group));
+    }
+    
+    std::vector<GroupHandle> handles;
+    handles.reserve(created.size());
+    for (auto& group : created) {
+        GroupHandle handle = NextGroupHandle();
+        groups_[handle] = std::move(group);
+        handles.push_back(handle);
+    }
+    
+    return handles;
+}
+
 void AudioManager::DestroyGroup(GroupHandle group) {
     EnsureInitialized();
     lock_guard<mutex> lock(resource_mutex_);
@@ -324,6 +403,14 @@ void AudioManager::DestroyGroup(GroupHandle group) {
     }
 }
 
+void AudioManager::DestroyGroups(const std::vector<GroupHandle>& groups) {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    for (GroupHandle group : groups) {
+        groups_.erase(group);
+    }
+}
+
 void AudioManager::SetGroupVolume(GroupHandle group, float volume) {
     EnsureInitialized();
     // Clamp volume to valid range [0.0, 1.0]
@@ -407,6 +494,41 @@ SoundHandle AudioManager::LoadSound(const string& filepath, GroupHandle group) {
     return handle;
 }
 
+std::vector<SoundHandle> AudioManager::LoadSounds(const std::vector<string>& filepaths, GroupHandle group) {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    
+    // Get the AudioGroup pointer
+    AudioGroup* group_ptr = nullptr;
+    if (group.IsValid()) {
+        auto group_it = groups_.find(group);
+        if (group_it != groups_.end()) {
+            group_ptr = group_it->second.get();
+        }
+    }
+    
+    // Create every sound before registering any, so a bad path leaves no partial batch
+    std::vector<unique_ptr<Sound>> loaded;
+    loaded.reserve(filepaths.size());
+    for (const auto& filepath : filepaths) {
+        auto sound_ptr = audio_system_->CreateSound(filepath, group_ptr);
+        if (!sound_ptr) {
+            throw FileLoadException("Failed to load sound file: " + filepath);
+        }
+        loaded.push_back(std::move(sound_ptr));
+    }
+    
+    std::vector<SoundHandle> handles;
+    handles.reserve(loaded.size());
+    for (auto& sound_ptr : loaded) {
+        SoundHandle handle = NextSoundHandle();
+        sounds_[handle] = std::move(sound_ptr);
+        handles.push_back(handle);
+    }
+    
+    return handles;
+}
+
 void AudioManager::DestroySound(SoundHandle sound) {
     EnsureInitialized();
     lock_guard<mutex> lock(resource_mutex_);
@@ -425,6 +547,27 @@ void AudioManager::DestroySound(SoundHandle sound) {
     }
 }
 
+void AudioManager::DestroySounds(const std::vector<SoundHandle>& sounds) {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    for (SoundHandle sound : sounds) {
+        sounds_.erase(sound);
+    }
+    // Cached folder handles always refer to live sounds, so anything no longer
+    // in sounds_ was destroyed above
+    for (auto folder_it = folder_sounds_.begin(); folder_it != folder_sounds_.end();) {
+        auto& handles = folder_it->second;
+        handles.erase(std::remove_if(handles.begin(), handles.end(),
+                                     [this](SoundHandle h) { return sounds_.find(h) == sounds_.end(); }),
+                      handles.end());
+        if (handles.empty()) {
+            folder_it = folder_sounds_.erase(folder_it);
+        } else {
+            ++folder_it;
+        }
+    }
+}
+
 void AudioManager::PlaySound(SoundHandle sound) {
     EnsureInitialized();
     lock_guard<mutex> lock(resource_mutex_);
@@ -445,6 +588,31 @@ void AudioManager::PlaySound(SoundHandle sound, const Vec3& position) {
     it->second->Play(position);
 }
 
+void AudioManager::PlaySoundBatch(SoundHandle sound, const std::vector<Vec3>& positions) {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    auto it = sounds_.find(sound);
+    if (it == sounds_.end() || !it->second) {
+        throw InvalidHandleException("Invalid sound handle: " + std::to_string(sound.Value()));
+    }
+    for (const auto& position : positions) {
+        it->second->Play(position);
+    }
+}
+
+void AudioManager::SchedulePlaySound(SoundHandle sound, const Vec3& position, std::chrono::milliseconds delay) {
+    EnsureInitialized();
+    if (delay.count() < 0) {
+        throw AudioException("Play delay must not be negative");
+    }
+    lock_guard<mutex> lock(resource_mutex_);
+    auto it = sounds_.find(sound);
+    if (it == sounds_.end() || !it->second) {
+        throw InvalidHandleException("Invalid sound handle: " + std::to_string(sound.Value()));
+    }
+    it->second->Play(position, delay);
+}
+
 void AudioManager::StopSound(SoundHandle sound) {
     EnsureInitialized();
     lock_guard<mutex> lock(resource_mutex_);
@@ -486,6 +654,16 @@ void AudioManager::SetSoundLooping(SoundHandle sound, bool should_loop) {
     it->second->SetLooping(should_loop);
 }
 
+void AudioManager::PreloadSound(SoundHandle sound) {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    auto it = sounds_.find(sound);
+    if (it == sounds_.end() || !it->second) {
+        throw InvalidHandleException("Invalid sound handle: " + std::to_string(sound.Value()));
+    }
+    it->second->Preload();
+}
+
 bool AudioManager::IsSoundPlaying(SoundHandle sound) const {
     EnsureInitialized();
     lock_guard<mutex> lock(resource_mutex_);
@@ -496,6 +674,16 @@ bool AudioManager::IsSoundPlaying(SoundHandle sound) const {
     return false;
 }
 
+size_t AudioManager::GetSoundInstanceCount(SoundHandle sound) const {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    auto it = sounds_.find(sound);
+    if (it != sounds_.end() && it->second) {
+        return it->second->GetInstanceCount();
+    }
+    return 0;
+}
+
 void AudioManager::PlayRandomSoundFromFolder(const string& folderPath, GroupHandle group) {
     EnsureInitialized();
     if (folderPath.empty()) {
@@ -704,6 +892,23 @@ void AudioManager::SetSoundMinDistance(SoundHandle sound, float minDistance) {
     it->second->SetMinDistance(minDistance);
 }
 
+void AudioManager::ConfigureSoundSpatial(SoundHandle sound, float minDistance, float maxDistance, float rolloff,
+                                         std::optional<Vec3> position) {
+    EnsureInitialized();
+    lock_guard<mutex> lock(resource_mutex_);
+    auto it = sounds_.find(sound);
+    if (it == sounds_.end() || !it->second) {
+        throw InvalidHandleException("Invalid sound handle: " + std::to_string(sound.Value()));
+    }
+    // Min first: max distance is validated against the current min
+    it->second->SetMinDistance(minDistance);
+    it->second->SetMaxDistance(maxDistance);
+    it->second->SetRolloff(rolloff);
+    if (position) {
+        it->second->SetPosition(*position);
+    }
+}
+
 float AudioManager::GetSoundMinDistance(SoundHandle sound) const {
     EnsureInitialized();
     lock_guard<mutex> lock(resource_mutex_);
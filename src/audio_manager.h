@@ -8,6 +8,7 @@
 #include <chrono>
 #include <string>
 #include <memory>
+#include <optional>
 #include <vector>
 #include <stdexcept>
 #include <random>
@@ -236,6 +237,16 @@ public:
      * @brief Get the current audio log level.
      */
     static LogLevel GetLogLevel();
+
+    /**
+     * @brief Set the audio log level and return the level it replaced.
+     *
+     * The swap is atomic, so save-and-restore of the level takes one call each way.
+     *
+     * @param level New logging level
+     * @return LogLevel The previous logging level
+     */
+    static LogLevel SwapLogLevel(LogLevel level);
     ///@}
 
     ///@name Track Management
@@ -251,6 +262,17 @@ public:
      */
     TrackHandle CreateTrack();
     
+    /**
+     * @brief Create several audio tracks at once
+     * 
+     * Equivalent to calling CreateTrack() count times, but takes the
+     * resource lock once for the whole batch.
+     * 
+     * @param count Number of tracks to create
+     * @return std::vector<TrackHandle> Handles to the newly created tracks
+     */
+    std::vector<TrackHandle> CreateTracks(size_t count);
+    
     /**
      * @brief Destroy an audio track
      * 
@@ -260,6 +282,16 @@ public:
      */
     void DestroyTrack(TrackHandle track);
     
+    /**
+     * @brief Destroy several audio tracks at once
+     * 
+     * Equivalent to calling DestroyTrack() for each handle, but takes the
+     * resource lock once for the whole batch. Unknown handles are ignored.
+     * 
+     * @param tracks Handles to the tracks to destroy
+     */
+    void DestroyTracks(const std::vector<TrackHandle>& tracks);
+    
     /**
      * @brief Start playing an audio track
      * 
@@ -318,6 +350,18 @@ public:
      */
     void SetLayerVolume(TrackHandle track, const string& layerName, float volume);
     
+    /**
+     * @brief Get the current volume of a specific layer
+     * 
+     * Reflects fade progress, so it reaches the target once a fade completes.
+     * 
+     * @param track Handle to the track
+     * @param layerName Name of the layer
+     * @return float Current volume level (0.0 to 1.0), or 0.0 for an unknown layer
+     * @throws InvalidHandleException If the track handle is invalid
+     */
+    float GetLayerVolume(TrackHandle track, const string& layerName) const;
+    
     /**
      * @brief Fade a layer's volume to a target value over time
      * 
@@ -327,6 +371,20 @@ public:
      * @param duration Duration of the fade in milliseconds
      */
     void FadeLayer(TrackHandle track, const string& layerName, float targetVolume, std::chrono::milliseconds duration);
+    
+    /**
+     * @brief Fade several layers of a track at once
+     * 
+     * Equivalent to calling FadeLayer() for each entry, but all fades start
+     * under a single lock so they begin on the same update tick. Useful for
+     * crossfades where one layer fades in while others fade out.
+     * 
+     * @param track Handle to the track
+     * @param targetVolumes Map of layer name to target volume (0.0 to 1.0)
+     * @param duration Duration of the fades in milliseconds
+     * @throws AudioException If the duration is not positive
+     */
+    void FadeLayers(TrackHandle track, const unordered_map<string, float>& targetVolumes, std::chrono::milliseconds duration);
     ///@}
     
     ///@name Group Operations
@@ -343,6 +401,18 @@ public:
      */
     GroupHandle CreateGroup();
     
+    /**
+     * @brief Create several audio groups at once
+     * 
+     * Equivalent to calling CreateGroup() count times, but takes the resource
+     * lock once for the whole batch. Either every group is created or none is.
+     * 
+     * @param count Number of groups to create
+     * @return std::vector<GroupHandle> Handles to the newly created groups
+     * @throws AudioException If group creation fails
+     */
+    std::vector<GroupHandle> CreateGroups(size_t count);
+    
     /**
      * @brief Destroy an audio group
      * 
@@ -350,6 +420,16 @@ public:
      */
     void DestroyGroup(GroupHandle group);
     
+    /**
+     * @brief Destroy several audio groups at once
+     * 
+     * Equivalent to calling DestroyGroup() for each handle, but takes the
+     * resource lock once for the whole batch. Unknown handles are ignored.
+     * 
+     * @param groups Handles to the groups to destroy
+     */
+    void DestroyGroups(const std::vector<GroupHandle>& groups);
+    
     /**
      * @brief Set the volume for an entire audio group
      * 
@@ -401,6 +481,21 @@ public:
      */
     SoundHandle LoadSound(const string& filepath, GroupHandle group);
     
+    /**
+     * @brief Load several sounds at once
+     * 
+     * Equivalent to calling LoadSound() for each path, but takes the resource
+     * lock once for the whole batch. Either every sound is loaded or none is:
+     * if any file cannot be loaded, nothing is registered and the exception
+     * propagates.
+     * 
+     * @param filepaths Paths to the audio files
+     * @param group Optional handle of the group to assign the sounds to (invalid = default/master)
+     * @return std::vector<SoundHandle> Handles to the loaded sounds, in the same order as filepaths
+     * @throws FileLoadException If any file cannot be found or loaded
+     */
+    std::vector<SoundHandle> LoadSounds(const std::vector<string>& filepaths, GroupHandle group = GroupHandle::Invalid());
+    
     /**
      * @brief Destroy a previously loaded sound
      * 
@@ -408,6 +503,17 @@ public:
      */
     void DestroySound(SoundHandle sound);
     
+    /**
+     * @brief Destroy several previously loaded sounds at once
+     * 
+     * Equivalent to calling DestroySound() for each handle, but takes the
+     * resource lock once and prunes the folder cache in a single pass.
+     * Unknown handles are ignored.
+     * 
+     * @param sounds Handles to the sounds to destroy
+     */
+    void DestroySounds(const std::vector<SoundHandle>& sounds);
+    
     /**
      * @brief Play a sound
      * 
@@ -440,7 +546,38 @@ public:
      * @throws InvalidHandleException If the sound handle is invalid
      */
     void PlaySound(SoundHandle sound, const Vec3& position);
-    
+
+    /**
+     * @brief Play a sound at several positions at once
+     *
+     * Starts one playback instance per position, equivalent to calling
+     * PlaySound(sound, position) for each entry, but the handle lookup and
+     * resource lock are only taken once for the whole batch. Useful for
+     * volleys of overlapping spatialized sounds (e.g., several enemies
+     * firing on the same frame).
+     *
+     * @param sound Handle to the sound
+     * @param positions 3D positions, one per new playback instance
+     * @throws InvalidHandleException If the sound handle is invalid
+     */
+    void PlaySoundBatch(SoundHandle sound, const std::vector<Vec3>& positions);
+
+    /**
+     * @brief Schedule a sound to play at a specific position after a delay
+     *
+     * The playback instance is created now and started on the audio engine's
+     * clock, so the sound begins exactly `delay` after the call without the
+     * caller having to sleep. Scheduled instances count as playing and can be
+     * cancelled with StopSound().
+     *
+     * @param sound Handle to the sound
+     * @param position 3D position for this playback instance
+     * @param delay Delay before the instance becomes audible (0 = immediately)
+     * @throws InvalidHandleException If the sound handle is invalid
+     * @throws AudioException If the delay is negative
+     */
+    void SchedulePlaySound(SoundHandle sound, const Vec3& position, std::chrono::milliseconds delay);
+
     /**
      * @brief Stop a currently playing sound
      * 
@@ -483,6 +620,31 @@ public:
      */
     bool IsSoundPlaying(SoundHandle sound) const;
     
+    /**
+     * @brief Count the instances of a sound that are playing or scheduled
+     * 
+     * Each PlaySound(), PlaySoundBatch() position or SchedulePlaySound()
+     * call adds one instance until it finishes or the sound is stopped.
+     * 
+     * @param sound Handle to the sound
+     * @return size_t Number of live instances, or 0 if the handle is invalid
+     */
+    size_t GetSoundInstanceCount(SoundHandle sound) const;
+    
+    /**
+     * @brief Decode a sound into memory ahead of playback
+     * 
+     * The decoded PCM is kept resident until the sound is destroyed and is
+     * shared by every instance, so PlaySound() no longer reads or decodes
+     * the file. Preloaded sounds are never streamed. Intended for short,
+     * frequently played effects; long music is better left streaming.
+     * 
+     * @param sound Handle to the sound
+     * @throws InvalidHandleException If the sound handle is invalid
+     * @throws FileLoadException If the sound file cannot be decoded
+     */
+    void PreloadSound(SoundHandle sound);
+    
     /**
      * @brief Play a random sound from a folder
      * 
@@ -679,6 +841,23 @@ public:
      */
     float GetSoundRolloff(SoundHandle sound) const;
     
+    /**
+     * @brief Set a sound's distance attenuation (and optionally its position) in one call
+     * 
+     * Equivalent to SetSoundMinDistance(), SetSoundMaxDistance(), SetSoundRolloff()
+     * and, if given, SetSoundPosition(), but looks the sound up once under a
+     * single lock. Values are validated the same way as by the individual setters.
+     * 
+     * @param sound Handle to the sound
+     * @param minDistance Minimum distance (must be > 0)
+     * @param maxDistance Maximum distance (must be > minDistance)
+     * @param rolloff Rolloff factor (typically 1.0 to 2.0)
+     * @param position Optional 3D position; the current position is kept if omitted
+     * @throws InvalidHandleException If the sound handle is invalid
+     */
+    void ConfigureSoundSpatial(SoundHandle sound, float minDistance, float maxDistance, float rolloff,
+                               std::optional<Vec3> position = std::nullopt);
+    
     /**
      * @brief Enable or disable spatialization for a sound
      * 
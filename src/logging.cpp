@@ -16,6 +16,10 @@ LogLevel Logger::GetLevel() {
     return g_level.load();
 }
 
+LogLevel Logger::ExchangeLevel(LogLevel level) {
+    return g_level.exchange(level);
+}
+
 bool Logger::IsEnabled(LogLevel level) {
     return g_level.load() >= level && level != LogLevel::Off;
 }
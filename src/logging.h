@@ -40,6 +40,11 @@ public:
      */
     static LogLevel GetLevel();
 
+    /**
+     * @brief Set the global log level and return the previous one atomically.
+     */
+    static LogLevel ExchangeLevel(LogLevel level);
+
     /**
      * @brief Check if a log level is enabled.
      */
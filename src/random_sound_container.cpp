@@ -50,6 +50,7 @@ void RandomSoundContainer::AddSound(const std::string& filepath) {
     }
     
     if (handle) {
+        ApplySpatialConfig(handle);
         sounds_.push_back(handle);
     }
 }
@@ -63,40 +64,62 @@ void RandomSoundContainer::LoadFromFolder(const std::string& folderPath) {
         return;
     }
 
-    size_t count = 0;
+    std::vector<std::string> paths;
+    std::vector<std::string> failed;
     for (const auto& entry : fs::directory_iterator(dir)) {
         if (!entry.is_regular_file())
             continue;
 
         auto path = entry.path();
         if (path.extension() == ".wav") {
+            // Open each header before the batch so one bad file is skipped
+            // on its own instead of failing the whole folder
+            ma_decoder decoder;
+            ma_decoder_config decoderConfig = ma_decoder_config_init(ma_format_f32, 0, 0);
+            if (ma_decoder_init_file(path.string().c_str(), &decoderConfig, &decoder) != MA_SUCCESS) {
+                AUDIO_LOG(LogLevel::Warn, "Skipping unreadable sound file: " << path.string());
+                failed.push_back(path.string());
+                continue;
+            }
+            
             // Check duration if maxDuration is set
+            bool tooLong = false;
             if (config_.maxDuration > 0.0f) {
-                ma_decoder decoder;
-                ma_decoder_config decoderConfig = ma_decoder_config_init(ma_format_f32, 0, 0);
-                
-                if (ma_decoder_init_file(path.string().c_str(), &decoderConfig, &decoder) == MA_SUCCESS) {
-                    ma_uint64 lengthInFrames;
-                    ma_decoder_get_length_in_pcm_frames(&decoder, &lengthInFrames);
-                    float durationInSeconds = (float)lengthInFrames / (float)decoder.outputSampleRate;
-                    ma_decoder_uninit(&decoder);
-                    
-                    if (durationInSeconds > config_.maxDuration) {
-                        continue; // Skip this file
-                    }
-                }
+                ma_uint64 lengthInFrames;
+                ma_decoder_get_length_in_pcm_frames(&decoder, &lengthInFrames);
+                float durationInSeconds = (float)lengthInFrames / (float)decoder.outputSampleRate;
+                tooLong = durationInSeconds > config_.maxDuration;
+            }
+            ma_decoder_uninit(&decoder);
+            
+            if (tooLong) {
+                continue; // Skip this file
             }
             
-            AddSound(path.string());
-            count++;
+            paths.push_back(path.string());
         }
     }
     
-    if (count > 0) {
-        AUDIO_LOG(LogLevel::Info, "Loaded " << count << " sound(s) from folder: " << folderPath);
-    } else {
+    // Register the whole folder under one lock rather than one LoadSound per file
+    if (!paths.empty()) {
+        std::vector<SoundHandle> loaded = audio.LoadSounds(paths, config_.group);
+        for (SoundHandle sound : loaded) {
+            ApplySpatialConfig(sound);
+        }
+        sounds_.insert(sounds_.end(), loaded.begin(), loaded.end());
+        AUDIO_LOG(LogLevel::Info, "Loaded " << paths.size() << " sound(s) from folder: " << folderPath);
+    } else if (failed.empty()) {
         AUDIO_LOG(LogLevel::Warn, "No .wav files found in folder: " << folderPath);
     }
+    
+    // Report the skipped files only after the good ones are in the container
+    if (!failed.empty()) {
+        std::string message = "Failed to load " + std::to_string(failed.size()) + " sound file(s) from folder " + folderPath + ":";
+        for (const auto& filepath : failed) {
+            message += " " + filepath;
+        }
+        throw FileLoadException(message);
+    }
 }
 
 void RandomSoundContainer::Play() {
@@ -181,4 +204,8 @@ SoundHandle RandomSoundContainer::SelectRandomSound() {
     return sounds_[dist(rng_)];
 }
 
+void RandomSoundContainer::ApplySpatialConfig(SoundHandle sound) {
+    AudioManager::GetInstance().ConfigureSoundSpatial(sound, config_.minDistance, config_.maxDistance, config_.rolloff);
+}
+
 } // namespace audio
@@ -17,6 +17,9 @@ struct RandomSoundContainerConfig {
     float pitchMax = 1.0f;             ///< Maximum pitch shift (1.0 = normal pitch)
     GroupHandle group = GroupHandle::Invalid(); ///< Audio group to assign sounds to
     float maxDuration = 0.0f;          ///< Maximum duration in seconds (0 = no limit)
+    float minDistance = 1.0f;          ///< Spatial min distance applied to each loaded sound
+    float maxDistance = 1000.0f;       ///< Spatial max distance applied to each loaded sound
+    float rolloff = 1.0f;              ///< Spatial rolloff factor applied to each loaded sound
 };
 
 /**
@@ -51,7 +54,11 @@ public:
     /**
      * @brief Load all .wav files from a folder
      * 
+     * Files that cannot be opened or decoded are skipped and the rest are
+     * still added, after which FileLoadException names the skipped files.
+     * 
      * @param folderPath Path to the folder containing sound files
+     * @throws FileLoadException if any .wav file in the folder cannot be loaded
      */
     void LoadFromFolder(const std::string& folderPath);
     
@@ -103,6 +110,15 @@ public:
      */
     size_t GetSoundCount() const { return sounds_.size(); }
     
+    /**
+     * @brief Get the handles of every sound in this container
+     * 
+     * The handles remain owned by the container and are destroyed with it.
+     * 
+     * @return const std::vector<SoundHandle>& Loaded sound handles, in load order
+     */
+    const std::vector<SoundHandle>& GetSounds() const { return sounds_; }
+    
     /**
      * @brief Get a random sound handle without playing it
      * 
@@ -126,6 +142,13 @@ private:
      * @return SoundHandle Handle to the selected sound
      */
     SoundHandle SelectRandomSound();
+    
+    /**
+     * @brief Apply the configured spatial attenuation settings to a loaded sound
+     * 
+     * @param sound Handle of a sound owned by this container
+     */
+    void ApplySpatialConfig(SoundHandle sound);
 };
 
 } // namespace audio
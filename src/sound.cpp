@@ -20,7 +20,7 @@ std::unique_ptr<Sound> Sound::Create(ma_engine* engine, const std::string& filep
   return std::unique_ptr<Sound>(new Sound(engine, filepath, group));
 }
 
-SoundInstance::SoundInstance() : sound(nullptr), finished(false) {}
+SoundInstance::SoundInstance() : sound(nullptr), finished(false), start_frame(0) {}
 
 SoundInstance::~SoundInstance() {
   if (sound) {
@@ -45,13 +45,18 @@ Sound::Sound(ma_engine* engine, const std::string& filepath, AudioGroup* group)
 
 Sound::~Sound() {
   Stop();  // Stops and cleans up all instances
+  
+  // Drop our reference to the cached PCM (shared with other Sounds for the same file)
+  if (preloaded_) {
+    ma_resource_manager_unregister_file(ma_engine_get_resource_manager(engine_), filepath_.c_str());
+  }
 }
 
 void Sound::CleanupFinishedInstances() {
   // Remove any instances that have finished playing
   auto it = sound_instances_.begin();
   while (it != sound_instances_.end()) {
-    if ((*it)->sound && ma_sound_is_playing((*it)->sound) == MA_FALSE) {
+    if ((*it)->sound && !IsInstanceLive(**it)) {
       it = sound_instances_.erase(it);  // Smart pointer handles cleanup
     } else {
       ++it;
@@ -64,6 +69,10 @@ void Sound::Play() {
 }
 
 void Sound::Play(const Vec3& position) {
+  Play(position, std::chrono::milliseconds(0));
+}
+
+void Sound::Play(const Vec3& position, std::chrono::milliseconds delay) {
   // First cleanup any finished instances
   CleanupFinishedInstances();
   
@@ -71,7 +80,7 @@ void Sound::Play(const Vec3& position) {
   if (looping_ && !sound_instances_.empty()) {
     // Just ensure the existing instance is playing
     for (auto& instance : sound_instances_) {
-      if (instance->sound && ma_sound_is_playing(instance->sound) == MA_FALSE) {
+      if (instance->sound && !IsInstanceLive(*instance)) {
         ma_sound_start(instance->sound);
       }
     }
@@ -83,8 +92,9 @@ void Sound::Play(const Vec3& position) {
   instance->sound = new ma_sound;
   
   // Stream large music files, don't stream small SFX for better sync
-  // Use streaming for files in music group or looping files (likely music)
-  uint32_t flags = (group_ != nullptr || looping_) ? MA_SOUND_FLAG_STREAM : 0;
+  // Use streaming for files in music group or looping files (likely music),
+  // unless the decoded data is already resident from Preload()
+  uint32_t flags = (!preloaded_ && (group_ != nullptr || looping_)) ? MA_SOUND_FLAG_STREAM : 0;
   AUDIO_LOG(LogLevel::Info, "[Sound::Play] Loading sound file: " << filepath_ << " (streaming: " << (flags ? "yes" : "no") << ")");
   ma_result result = ma_sound_init_from_file(
       engine_,
@@ -119,6 +129,13 @@ void Sound::Play(const Vec3& position) {
     ma_sound_set_rolloff(instance->sound, rolloff_);
   }
   
+  // Schedule against the engine clock so delayed starts are sample-accurate
+  if (delay.count() > 0) {
+    ma_uint64 delay_frames = static_cast<ma_uint64>(delay.count()) * ma_engine_get_sample_rate(engine_) / 1000;
+    instance->start_frame = ma_engine_get_time_in_pcm_frames(engine_) + delay_frames;
+    ma_sound_set_start_time_in_pcm_frames(instance->sound, instance->start_frame);
+  }
+  
   ma_sound_start(instance->sound);
   
   // Add to our list of instances
@@ -163,16 +180,52 @@ void Sound::SetPitch(float pitch) {
   pitch_ = (std::min)(MAX_PITCH, (std::max)(MIN_PITCH, pitch));
 }
 
+void Sound::Preload() {
+  if (preloaded_) {
+    return;
+  }
+  
+  // The resource manager keys buffers by path, so instances initialized from
+  // this file afterwards pick up the decoded buffer instead of loading their own
+  ma_result result = ma_resource_manager_register_file(
+      ma_engine_get_resource_manager(engine_),
+      filepath_.c_str(),
+      MA_RESOURCE_MANAGER_DATA_SOURCE_FLAG_DECODE);
+  if (result != MA_SUCCESS) {
+    AUDIO_LOG(LogLevel::Error, "[Sound::Preload] FAILED to decode sound file: " << filepath_ << " (error code: " << result << ")");
+    throw FileLoadException("Failed to preload sound file: " + filepath_ + " (error code: " + std::to_string(result) + ")");
+  }
+  AUDIO_LOG(LogLevel::Info, "[Sound::Preload] Decoded into memory: " << filepath_);
+  preloaded_ = true;
+}
+
+bool Sound::IsInstanceLive(const SoundInstance& instance) const {
+  if (!instance.sound) {
+    return false;
+  }
+  if (ma_sound_is_playing(instance.sound) == MA_TRUE) {
+    return true;
+  }
+  // Not audible yet but scheduled for a later engine frame
+  return instance.start_frame > ma_engine_get_time_in_pcm_frames(engine_);
+}
+
 bool Sound::IsPlaying() const {
-  // Return true if any instance is playing
+  // Return true if any instance is playing or scheduled
   for (const auto& instance : sound_instances_) {
-    if (instance->sound && ma_sound_is_playing(instance->sound) == MA_TRUE) {
+    if (IsInstanceLive(*instance)) {
       return true;
     }
   }
   return false;
 }
 
+size_t Sound::GetInstanceCount() const {
+  return static_cast<size_t>(std::count_if(
+      sound_instances_.begin(), sound_instances_.end(),
+      [this](const auto& instance) { return IsInstanceLive(*instance); }));
+}
+
 // Spatial Audio Methods
 void Sound::SetPosition(const Vec3& position) {
   position_ = position;
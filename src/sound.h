@@ -2,6 +2,7 @@
 
 #include "miniaudio/miniaudio.h"
 #include "vec3.h"
+#include <chrono>
 #include <memory>
 #include <string>
 #include <vector>
@@ -26,6 +27,7 @@ class AudioGroup;
 struct SoundInstance {
   ma_sound* sound;       ///< Pointer to miniaudio sound
   bool finished;         ///< Flag indicating if this instance has finished playing
+  ma_uint64 start_frame; ///< Engine frame the instance is scheduled to start on (0 = immediately)
   
   /**
    * @brief Constructor
@@ -128,6 +130,19 @@ class Sound {
    */
   void Play(const Vec3& position);
   
+  /**
+   * @brief Starts a new instance of the sound at a specific position after a delay
+   * 
+   * The instance is created immediately but scheduled on the engine clock,
+   * so it begins on the exact PCM frame that corresponds to the delay rather
+   * than whenever the caller next gets to run.
+   * 
+   * @param position 3D position for this instance
+   * @param delay Time from now until the instance becomes audible
+   * @throws FileLoadException If the sound file cannot be loaded or initialized for playback
+   */
+  void Play(const Vec3& position, std::chrono::milliseconds delay);
+  
   /**
    * @brief Stops all instances of this sound
    * 
@@ -156,6 +171,19 @@ class Sound {
    */
   void SetPitch(float pitch);
   
+  /**
+   * @brief Decodes the audio file once and keeps the PCM data resident
+   * 
+   * Registers the file with the engine's resource manager in decoded form.
+   * Later instances share that buffer instead of re-reading and decoding
+   * the file, and instances are no longer streamed even if the sound
+   * belongs to a group or loops. The data is released when the Sound is
+   * destroyed. Calling this more than once has no further effect.
+   * 
+   * @throws FileLoadException If the sound file cannot be decoded
+   */
+  void Preload();
+  
   ///@name Spatial Audio (3D Positioning)
   ///@{
   
@@ -261,12 +289,26 @@ class Sound {
    */
   bool IsLooping() const { return looping_; }
   
+  /**
+   * @brief Checks if the decoded PCM data is held in memory
+   * 
+   * @return bool True if Preload() has been called, false otherwise
+   */
+  bool IsPreloaded() const { return preloaded_; }
+  
   /**
    * @brief Checks if any instance of this sound is playing
    * 
    * @return bool True if any instance is playing, false otherwise
    */
   bool IsPlaying() const;
+  
+  /**
+   * @brief Counts the instances that are playing or scheduled to play
+   * 
+   * @return size_t Number of live instances
+   */
+  size_t GetInstanceCount() const;
   ///@}
 
  private:
@@ -277,6 +319,17 @@ class Sound {
    */
   void CleanupFinishedInstances();
   
+  /**
+   * @brief Checks if an instance is playing or still waiting for its start time
+   * 
+   * miniaudio reports a sound with a future start time as not playing, so
+   * the scheduled start frame is compared against the engine clock as well.
+   * 
+   * @param instance Instance to check
+   * @return bool True if the instance is playing or scheduled, false if it has finished
+   */
+  bool IsInstanceLive(const SoundInstance& instance) const;
+  
   std::vector<std::unique_ptr<SoundInstance>> sound_instances_; ///< Collection of playing instances
   ma_engine* engine_;                                ///< Pointer to miniaudio engine
   ma_sound_group* group_;                            ///< Pointer to parent sound group (if any)
@@ -284,6 +337,7 @@ class Sound {
   bool looping_;                                     ///< Whether new instances should loop
   float volume_;                                     ///< Current volume level
   float pitch_;                                      ///< Pitch for next instance (1.0 = normal)
+  bool preloaded_ = false;                           ///< Whether decoded PCM is registered with the resource manager
   
   ///@name Spatial Audio State
   ///@{
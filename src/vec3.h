@@ -123,6 +123,19 @@ struct Vec3 {
         return (*this - other).LengthSquared();
     }
 
+    /**
+     * @brief Check whether every component is within a tolerance of another vector
+     * 
+     * @param other Vector to compare against
+     * @param tolerance Maximum absolute difference allowed per component
+     * @return bool True if all three components are within tolerance
+     */
+    bool AllClose(const Vec3& other, float tolerance = 1e-4f) const {
+        return std::abs(x - other.x) <= tolerance &&
+               std::abs(y - other.y) <= tolerance &&
+               std::abs(z - other.z) <= tolerance;
+    }
+
     // Arithmetic operators
     Vec3 operator+(const Vec3& other) const {
         return Vec3(x + other.x, y + other.y, z + other.z);
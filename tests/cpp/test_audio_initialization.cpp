@@ -90,21 +90,21 @@ void test_rapid_shutdown_reinitialize() {
     
     auto& audio = AudioManager::GetInstance();
     
-    // Perform multiple shutdown/reinitialize cycles
+    // Perform back-to-back shutdown/reinitialize cycles
     for (int i = 0; i < 5; i++) {
         audio.Shutdown();
-        wait_ms(50);
+        ASSERT(!audio.IsInitialized(), "Should be fully shut down after Shutdown()")
         ASSERT(audio.Initialize(), "Should be able to reinitialize after shutdown")
-        wait_ms(50);
-        
-        // Verify system works after reinitialize
-        GroupHandle group = audio.CreateGroup();
-        audio.SetGroupVolume(group, 0.5f);
-        ASSERT(std::abs(audio.GetGroupVolume(group) - 0.5f) < 0.01f, 
-               "System should work after reinitialize")
-        audio.DestroyGroup(group);
+        ASSERT(audio.IsInitialized(), "Should report initialized after Initialize()")
     }
     
+    // Verify system works after the final reinitialize
+    GroupHandle group = audio.CreateGroup();
+    audio.SetGroupVolume(group, 0.5f);
+    ASSERT(std::abs(audio.GetGroupVolume(group) - 0.5f) < 0.01f, 
+           "System should work after reinitialize")
+    audio.DestroyGroup(group);
+    
     END_TEST
 }
 
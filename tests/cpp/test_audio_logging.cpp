@@ -122,6 +122,11 @@ void test_logging_persistence() {
     AudioManager::SetLogLevel(LogLevel::Debug);
     ASSERT(AudioManager::GetLogLevel() == LogLevel::Debug, "Level should update")
     
+    // Swap sets the new level and hands back the old one
+    auto previous = AudioManager::SwapLogLevel(LogLevel::Error);
+    ASSERT(previous == LogLevel::Debug, "SwapLogLevel should return the previous level")
+    ASSERT(AudioManager::GetLogLevel() == LogLevel::Error, "SwapLogLevel should set the new level")
+    
     AudioManager::SetLogLevel(original);
     END_TEST
 }
@@ -15,26 +15,29 @@ void test_resource_cleanup() {
     
     auto& audio = AudioManager::GetInstance();
     
-    // Create many resources
-    std::vector<GroupHandle> groups;
-    std::vector<TrackHandle> tracks;
-    std::vector<SoundHandle> sounds;
-    
-    for (int i = 0; i < 10; i++) {
-        groups.push_back(audio.CreateGroup());
-        tracks.push_back(audio.CreateTrack());
-        sounds.push_back(audio.LoadSound(sound_dir + "/digital_base.wav"));
-    }
+    // Create many resources, one call per kind
+    std::vector<GroupHandle> groups = audio.CreateGroups(10);
+    std::vector<TrackHandle> tracks = audio.CreateTracks(10);
+    std::vector<SoundHandle> sounds = audio.LoadSounds(
+        std::vector<std::string>(10, sound_dir + "/digital_base.wav"));
     
     ASSERT(groups.size() == 10, "Should create 10 groups")
     ASSERT(tracks.size() == 10, "Should create 10 tracks")
     ASSERT(sounds.size() == 10, "Should load 10 sounds")
-    
-    // Clean up all resources
-    for (auto g : groups) audio.DestroyGroup(g);
-    for (auto t : tracks) audio.DestroyTrack(t);
-    for (auto s : sounds) audio.DestroySound(s);
-    
+    ASSERT(groups[0] != groups[9] && tracks[0] != tracks[9], "Batch handles should be unique")
+    
+    // Clean up all resources in one call per kind; unknown handles are ignored
+    groups.push_back(GroupHandle{9999});
+    audio.DestroyGroups(groups);
+    audio.DestroyTracks(tracks);
+    audio.DestroySounds(sounds);
+    
+    ASSERT_THROWS(InvalidHandleException, audio.SetGroupVolume(groups[0], 0.5f),
+                  "Batch-destroyed group should be invalid");
+    ASSERT_THROWS(InvalidHandleException, audio.PlayTrack(tracks[0]),
+                  "Batch-destroyed track should be invalid");
+    ASSERT_THROWS(InvalidHandleException, audio.PlaySound(sounds[0]),
+                  "Batch-destroyed sound should be invalid");
     ASSERT(true, "Mass resource cleanup should complete")
     
     END_TEST
@@ -35,6 +35,34 @@ void test_sound_loading() {
     END_TEST
 }
 
+void test_load_sounds_batch() {
+    TEST("Batch Sound Loading")
+    
+    auto& audio = AudioManager::GetInstance();
+    GroupHandle group = audio.CreateGroup();
+    
+    std::vector<std::string> paths = {
+        sound_dir + "/digital_base.wav",
+        sound_dir + "/hit.wav"
+    };
+    std::vector<SoundHandle> sounds = audio.LoadSounds(paths, group);
+    ASSERT(sounds.size() == 2, "Should return one handle per path")
+    ASSERT(sounds[0].IsValid() && sounds[1].IsValid(), "Batch-loaded sounds should be valid")
+    ASSERT(sounds[0] != sounds[1], "Batch-loaded sounds should have distinct handles")
+    
+    for (auto sound : sounds) {
+        audio.DestroySound(sound);
+    }
+    
+    // A missing file fails the whole batch
+    paths.push_back(sound_dir + "/does_not_exist.wav");
+    ASSERT_THROWS(FileLoadException, audio.LoadSounds(paths), "Batch with a missing file should throw");
+    
+    audio.DestroyGroup(group);
+    
+    END_TEST
+}
+
 void test_sound_playback() {
     TEST("Sound Playback Control")
     
@@ -96,6 +124,39 @@ void test_multiple_instances() {
     END_TEST
 }
 
+void test_preload_sound() {
+    TEST("Sound Preloading")
+    
+    auto& audio = AudioManager::GetInstance();
+    GroupHandle group = audio.CreateGroup();
+    
+    // Two sounds for the same file share one decoded buffer
+    std::string sound_path = sound_dir + "/hit.wav";
+    SoundHandle first = audio.LoadSound(sound_path, group);
+    SoundHandle second = audio.LoadSound(sound_path, group);
+    audio.PreloadSound(first);
+    audio.PreloadSound(first);  // Second call is a no-op
+    audio.PreloadSound(second);
+    
+    audio.PlaySound(first);
+    audio.PlaySound(first);
+    ASSERT(audio.IsSoundPlaying(first), "Preloaded sound should play")
+    audio.StopSound(first);
+    
+    // Releasing one sound must not free the buffer still used by the other
+    audio.DestroySound(first);
+    audio.PlaySound(second);
+    ASSERT(audio.IsSoundPlaying(second), "Shared buffer should survive destroying one sound")
+    audio.StopSound(second);
+    audio.DestroySound(second);
+    
+    ASSERT_THROWS(InvalidHandleException, audio.PreloadSound(first), "Preloading a destroyed sound should throw");
+    
+    audio.DestroyGroup(group);
+    
+    END_TEST
+}
+
 void test_random_sound_folder() {
     TEST("Random Sound From Folder")
     
@@ -143,8 +204,10 @@ int main(int argc, char* argv[]) {
     
     // Run all tests
     test_sound_loading();
+    test_load_sounds_batch();
     test_sound_playback();
     test_multiple_instances();
+    test_preload_sound();
     test_random_sound_folder();
     
     // Final shutdown
@@ -34,6 +34,10 @@ void test_vec3_basic_operations() {
     ASSERT(v2 == v3, "Equal Vec3s should compare equal")
     ASSERT(v1 != v2, "Different Vec3s should compare not equal")
     
+    // Approximate equality
+    ASSERT(v2.AllClose(Vec3(1.0005f, 2.0f, 3.0f), 0.001f), "Vec3s within tolerance should be close")
+    ASSERT(!v2.AllClose(Vec3(1.0f, 2.0f, 3.1f), 0.001f), "Vec3s outside tolerance should not be close")
+    
     // Length
     Vec3 v4(3.0f, 4.0f, 0.0f);
     ASSERT(std::abs(v4.Length() - 5.0f) < 0.001f, "Vec3 length should be calculated correctly")
@@ -289,6 +293,19 @@ void test_sound_distance_attenuation() {
                   audio.SetSoundMinDistance(SoundHandle::Invalid(), 1.0f),
                   "Setting min distance on invalid handle should throw");
     
+    // Configure everything in one call
+    audio.ConfigureSoundSpatial(sound, 2.0f, 40.0f, 1.5f, Vec3(1.0f, 2.0f, 3.0f));
+    ASSERT(std::abs(audio.GetSoundMinDistance(sound) - 2.0f) < 0.001f &&
+           std::abs(audio.GetSoundMaxDistance(sound) - 40.0f) < 0.001f &&
+           std::abs(audio.GetSoundRolloff(sound) - 1.5f) < 0.001f,
+           "ConfigureSoundSpatial should set all attenuation parameters")
+    ASSERT(audio.GetSoundPosition(sound) == Vec3(1.0f, 2.0f, 3.0f), "ConfigureSoundSpatial should set position")
+    audio.ConfigureSoundSpatial(sound, 1.0f, 20.0f, 1.0f);
+    ASSERT(audio.GetSoundPosition(sound) == Vec3(1.0f, 2.0f, 3.0f), "Omitted position should be left unchanged")
+    ASSERT_THROWS(InvalidHandleException,
+                  audio.ConfigureSoundSpatial(SoundHandle::Invalid(), 1.0f, 20.0f, 1.0f),
+                  "Configuring an invalid handle should throw");
+    
     audio.DestroySound(sound);
     
     END_TEST
@@ -546,6 +563,79 @@ void test_overlapping_spatial_sounds() {
     END_TEST
 }
 
+void test_play_sound_batch() {
+    TEST("Play Sound Batch at Multiple Positions")
+    
+    auto& audio = AudioManager::GetInstance();
+    
+    audio.SetListenerPosition(Vec3(0.0f, 0.0f, 0.0f));
+    
+    SoundHandle sound = audio.LoadSound(sound_dir + "/digital_base.wav");
+    
+    std::vector<Vec3> positions = {
+        Vec3(5.0f, 0.0f, 0.0f),
+        Vec3(-5.0f, 0.0f, 0.0f),
+        Vec3(0.0f, 0.0f, 5.0f)
+    };
+    
+    audio.PlaySoundBatch(sound, positions);
+    wait_ms(100);
+    ASSERT(audio.IsSoundPlaying(sound), "Batched instances should be playing")
+    
+    audio.StopSound(sound);
+    wait_ms(50);
+    ASSERT(!audio.IsSoundPlaying(sound), "All batched instances should be stopped")
+    
+    // An empty batch is a no-op
+    audio.PlaySoundBatch(sound, {});
+    ASSERT(!audio.IsSoundPlaying(sound), "Empty batch should not start playback")
+    
+    ASSERT_THROWS(InvalidHandleException,
+                  audio.PlaySoundBatch(SoundHandle{99999}, positions),
+                  "Batch with invalid handle should throw");
+    
+    audio.DestroySound(sound);
+    
+    END_TEST
+}
+
+void test_schedule_play_sound() {
+    TEST("Schedule Sound at Position with Delay")
+    
+    auto& audio = AudioManager::GetInstance();
+    
+    audio.SetListenerPosition(Vec3(0.0f, 0.0f, 0.0f));
+    
+    SoundHandle sound = audio.LoadSound(sound_dir + "/digital_base.wav");
+    
+    // Scheduled instances are live immediately, even before they are audible
+    audio.SchedulePlaySound(sound, Vec3(5.0f, 0.0f, 0.0f), std::chrono::milliseconds(150));
+    ASSERT(audio.IsSoundPlaying(sound), "A pending instance should count as playing")
+    
+    // Scheduling again must not discard the instance that has not started yet
+    audio.SchedulePlaySound(sound, Vec3(-5.0f, 0.0f, 0.0f), std::chrono::milliseconds(300));
+    ASSERT(audio.IsSoundPlaying(sound), "Scheduled instances should count as playing")
+    ASSERT(audio.GetSoundInstanceCount(sound) == 2, "Both pending instances should survive the second schedule")
+    
+    wait_ms(400);
+    ASSERT(audio.GetSoundInstanceCount(sound) == 2, "Both scheduled instances should have started")
+    
+    audio.StopSound(sound);
+    wait_ms(50);
+    ASSERT(!audio.IsSoundPlaying(sound), "Stopping should cancel scheduled instances")
+    
+    ASSERT_THROWS(AudioException,
+                  audio.SchedulePlaySound(sound, Vec3(), std::chrono::milliseconds(-1)),
+                  "Negative delay should throw");
+    ASSERT_THROWS(InvalidHandleException,
+                  audio.SchedulePlaySound(SoundHandle{99999}, Vec3(), std::chrono::milliseconds(10)),
+                  "Scheduling an invalid handle should throw");
+    
+    audio.DestroySound(sound);
+    
+    END_TEST
+}
+
 void test_random_container_get_random_sound() {
     TEST("RandomSoundContainer GetRandomSound")
     
@@ -560,6 +650,8 @@ void test_random_container_get_random_sound() {
     container.AddSound(sound_dir + "/hit.wav");
     
     ASSERT(container.GetSoundCount() == 2, "Container should have 2 sounds")
+    ASSERT(container.GetSounds().size() == 2 && container.GetSounds()[0] != container.GetSounds()[1],
+           "GetSounds should return each loaded handle")
     
     // Get random sounds multiple times
     SoundHandle sound1 = container.GetRandomSound();
@@ -579,6 +671,26 @@ void test_random_container_get_random_sound() {
     END_TEST
 }
 
+void test_random_container_spatial_config() {
+    TEST("RandomSoundContainer Spatial Config")
+    
+    auto& audio = AudioManager::GetInstance();
+    
+    RandomSoundContainerConfig config;
+    config.minDistance = 2.0f;
+    config.maxDistance = 30.0f;
+    config.rolloff = 1.5f;
+    RandomSoundContainer container("spatial_container", config);
+    container.AddSound(sound_dir + "/hit.wav");
+    
+    SoundHandle sound = container.GetRandomSound();
+    ASSERT(std::abs(audio.GetSoundMinDistance(sound) - 2.0f) < 0.001f, "Min distance applied on load")
+    ASSERT(std::abs(audio.GetSoundMaxDistance(sound) - 30.0f) < 0.001f, "Max distance applied on load")
+    ASSERT(std::abs(audio.GetSoundRolloff(sound) - 1.5f) < 0.001f, "Rolloff applied on load")
+    
+    END_TEST
+}
+
 int main(int argc, char* argv[]) {
     std::cout << "========================================" << std::endl;
     std::cout << "Audio System Spatial Audio Tests" << std::endl;
@@ -610,7 +722,10 @@ int main(int argc, char* argv[]) {
     test_spatial_audio_with_playback();
     test_play_sound_at_position();
     test_overlapping_spatial_sounds();
+    test_play_sound_batch();
+    test_schedule_play_sound();
     test_random_container_get_random_sound();
+    test_random_container_spatial_config();
     
     // Final shutdown
     audio.Shutdown();
@@ -6,6 +6,7 @@
 
 #include "test_common.h"
 #include "audio_manager.h"
+#include <cmath>
 
 using namespace audio;
 using namespace std::chrono_literals;
@@ -36,8 +37,8 @@ void test_track_operations() {
     
     // Test layer fade
     audio.FadeLayer(track, "layer2", 1.0f, 300ms);
-    wait_ms(350);
-    ASSERT(true, "Layer fade should complete")
+    ASSERT(wait_until([&] { return std::abs(audio.GetLayerVolume(track, "layer2") - 1.0f) < 0.01f; }),
+           "Layer fade should complete")
     
     // Stop track
     audio.StopTrack(track);
@@ -73,11 +74,40 @@ void test_audio_track_update_fix() {
     audio.FadeLayer(track, "layer1", 1.0f, 500ms);
     audio.FadeLayer(track, "layer2", 0.5f, 300ms);
     
-    // Wait for fades to complete
-    wait_ms(600);
+    // Verify volumes are set correctly once the fades complete
+    ASSERT(wait_until([&] { return std::abs(audio.GetLayerVolume(track, "layer1") - 1.0f) < 0.01f; }),
+           "layer1 fade should complete")
+    ASSERT(std::abs(audio.GetLayerVolume(track, "layer2") - 0.5f) < 0.01f,
+           "layer2 fade should complete")
     
-    // Verify volumes are set correctly (fade should have completed)
-    ASSERT(true, "Fade operations should complete without issues")
+    audio.StopTrack(track);
+    audio.DestroyTrack(track);
+    
+    END_TEST
+}
+
+void test_fade_layers() {
+    TEST("Fade Multiple Layers at Once")
+    
+    auto& audio = AudioManager::GetInstance();
+    
+    TrackHandle track = audio.CreateTrack();
+    audio.AddLayer(track, "layer1", sound_dir + "/digital_base.wav");
+    audio.AddLayer(track, "layer2", sound_dir + "/digital_battle.wav");
+    audio.SetLayerVolume(track, "layer1", 1.0f);
+    audio.SetLayerVolume(track, "layer2", 0.0f);
+    audio.PlayTrack(track);
+    
+    // Crossfade both layers in one call
+    audio.FadeLayers(track, {{"layer1", 0.0f}, {"layer2", 1.0f}}, 300ms);
+    ASSERT(wait_until([&] { return std::abs(audio.GetLayerVolume(track, "layer2") - 1.0f) < 0.01f; }),
+           "Crossfade should complete")
+    ASSERT(std::abs(audio.GetLayerVolume(track, "layer1")) < 0.01f,
+           "Both layers should fade together")
+    
+    ASSERT_THROWS(AudioException,
+                  audio.FadeLayers(track, {{"layer1", 1.0f}}, 0ms),
+                  "Zero fade duration should throw");
     
     audio.StopTrack(track);
     audio.DestroyTrack(track);
@@ -103,6 +133,7 @@ int main(int argc, char* argv[]) {
     // Run all tests
     test_track_operations();
     test_audio_track_update_fix();
+    test_fade_layers();
     
     // Final shutdown
     audio.Shutdown();
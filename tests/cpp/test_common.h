@@ -71,6 +71,19 @@ inline void wait_ms(int ms) {
     std::this_thread::sleep_for(std::chrono::milliseconds(ms));
 }
 
+// Poll predicate until it holds or timeout_ms elapses; returns its final value
+template <typename Predicate>
+bool wait_until(Predicate predicate, int timeout_ms = 1000, int poll_ms = 1) {
+    auto deadline = std::chrono::steady_clock::now() + std::chrono::milliseconds(timeout_ms);
+    while (!predicate()) {
+        if (std::chrono::steady_clock::now() >= deadline) {
+            return predicate();
+        }
+        wait_ms(poll_ms);
+    }
+    return true;
+}
+
 // Helper to get sound directory path
 inline std::string get_sound_dir(int argc, char* argv[]) {
     if (argc > 1) {
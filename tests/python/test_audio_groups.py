@@ -21,15 +21,29 @@ def test_group_operations():
     
     # Test volume control
     audio.set_group_volume(music, 0.7)
-    assert abs(audio.get_group_volume(music) - 0.7) < 0.01, "Music group volume should be 0.7"
+    assert isclose(audio.get_group_volume(music), 0.7, abs_tol=0.01), "Music group volume should be 0.7"
     
     audio.set_group_volume(sfx, 0.3)
-    assert abs(audio.get_group_volume(sfx) - 0.3) < 0.01, "SFX group volume should be 0.3"
+    assert isclose(audio.get_group_volume(sfx), 0.3, abs_tol=0.01), "SFX group volume should be 0.3"
     
-    # Test fade (non-blocking, just verify it doesn't crash)
+    # Test fade (non-blocking); returns as soon as the update thread has started it
     audio.fade_group(music, 0.0, timedelta(milliseconds=500))
-    wait_ms(100)
-    assert True, "Group fade operation should not crash"
+    assert wait_until(lambda: audio.get_group_volume(music) < 0.7), "Group fade should start"
+    
+    # A float duration is taken as seconds
+    audio.fade_group(sfx, 0.0, 0.1)
+    assert wait_until(lambda: isclose(audio.get_group_volume(sfx), 0.0, abs_tol=0.01), timeout_ms=500), \
+        "Float-seconds group fade should reach its target"
+    
+    # Durations have millisecond resolution; a positive sub-millisecond one becomes 1 ms
+    audio.fade_group(sfx, 0.5, 0.0004)
+    assert wait_until(lambda: isclose(audio.get_group_volume(sfx), 0.5, abs_tol=0.01), timeout_ms=500), \
+        "Sub-millisecond group fade should complete instead of raising"
+    try:
+        audio.fade_group(sfx, 0.5, 0.0)
+        assert False, "Zero float duration should raise"
+    except game_audio.AudioException:
+        pass
     
     # Cleanup
     audio.destroy_group(music)
@@ -40,24 +54,13 @@ def test_group_operations():
 def run_all_tests():
     """Run all group tests"""
     print("=== Python Audio Group Tests ===\n")
+    quiet_logging()
     
     tests = [
         test_group_operations,
     ]
     
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except AssertionError as e:
-            print(f"FAIL - {e}")
-            failed += 1
-        except Exception as e:
-            print(f"ERROR - {e}")
-            failed += 1
+    passed, failed = run_tests(tests, teardown=shutdown_audio)
     
     print(f"\n=== Results: {passed} passed, {failed} failed ===")
     return failed == 0
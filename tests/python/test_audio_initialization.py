@@ -1,6 +1,6 @@
 """
 Audio System Initialization Tests
-Tests system initialization, shutdown, AudioSession, and logging controls.
+Tests system initialization, shutdown, and AudioSession.
 """
 
 from test_common import *
@@ -18,55 +18,28 @@ def test_audio_session_usage():
     print("Test: AudioSession usage... ", end="", flush=True)
     session = game_audio.AudioSession()
     audio = game_audio.AudioManager.get_instance()
-    group = audio.create_group()
-    audio.set_group_volume(group, 0.5)
-    audio.destroy_group(group)
+    with temp_group(audio) as group:
+        audio.set_group_volume(group, 0.5)
     session.close()
     print("PASS")
 
-def test_logging_controls():
-    """Test: Logging controls are accessible and work correctly"""
-    print("Test: Logging controls... ", end="", flush=True)
-    
-    # Test that logging is always available (no compile-time flag needed)
-    original = game_audio.AudioManager.get_log_level()
-    
-    # Test all log levels can be set
-    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Off)
-    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Off, "Log level should be Off"
-    
-    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Error)
-    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Error, "Log level should be Error"
-    
-    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Warn)
-    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Warn, "Log level should be Warn"
-    
-    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Info)
-    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Info, "Log level should be Info"
-    
-    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Debug)
-    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Debug, "Log level should be Debug"
-    
-    # Restore original level
-    game_audio.AudioManager.set_log_level(original)
-    print("PASS")
-
 def test_rapid_shutdown_reinitialize():
     """Test: Rapid shutdown/reinitialize cycles"""
     print("Test: Rapid shutdown/reinitialize... ", end="", flush=True)
     audio = game_audio.AudioManager.get_instance()
     
+    # Back-to-back cycles; shutdown() joins the update thread and initialize() reports
+    # failure itself, so each transition is checked directly instead of sleeping
     for i in range(5):
         audio.shutdown()
-        wait_ms(50)
+        assert not audio.is_initialized(), f"Should be fully shut down (cycle {i+1})"
         assert audio.initialize(), f"Should be able to reinitialize after shutdown (cycle {i+1})"
-        wait_ms(50)
-        
-        # Verify system works after reinitialize
-        group = audio.create_group()
+        assert audio.is_initialized(), f"Should report initialized (cycle {i+1})"
+    
+    # Verify system works after the final reinitialize
+    with temp_group(audio) as group:
         audio.set_group_volume(group, 0.5)
-        assert abs(audio.get_group_volume(group) - 0.5) < 0.01, "System should work after reinitialize"
-        audio.destroy_group(group)
+        assert isclose(audio.get_group_volume(group), 0.5, abs_tol=0.01), "System should work after reinitialize"
     
     # Ensure we shutdown at the end
     audio.shutdown()
@@ -75,27 +48,15 @@ def test_rapid_shutdown_reinitialize():
 def run_all_tests():
     """Run all initialization tests"""
     print("=== Python Audio Initialization Tests ===\n")
+    quiet_logging()
     
     tests = [
         test_basic_initialization,
         test_audio_session_usage,
-        test_logging_controls,
         test_rapid_shutdown_reinitialize,
     ]
     
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except AssertionError as e:
-            print(f"FAIL - {e}")
-            failed += 1
-        except Exception as e:
-            print(f"ERROR - {e}")
-            failed += 1
+    passed, failed = run_tests(tests, teardown=shutdown_audio)
     
     print(f"\n=== Results: {passed} passed, {failed} failed ===")
     return failed == 0
@@ -7,42 +7,28 @@ Tests that logging functionality works correctly with the simplified system
 from test_common import *
 import sys
 
+@restores_log_level
 def test_logging_levels():
     """Test: Logging level hierarchy"""
     print("Test: Logging level hierarchy... ", end="", flush=True)
     
-    original = game_audio.AudioManager.get_log_level()
+    # Off disables everything; each following level is strictly more verbose
+    assert LOG_LEVELS[0] == game_audio.LogLevel.Off and int(game_audio.LogLevel.Off) == 0, \
+        "Off should be the lowest level"
+    values = [int(level) for level in LOG_LEVELS]
+    assert values == sorted(set(values)), "Levels should be strictly ordered from Off to Debug"
+    assert len(LOG_LEVELS) == len(game_audio.LogLevel.__members__), "Every level should be covered"
     
-    # Test that Off disables everything
-    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Off)
-    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Off, "Level should be Off"
-    
-    # Test Error level
-    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Error)
-    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Error, "Level should be Error"
-    
-    # Test Warn level
-    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Warn)
-    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Warn, "Level should be Warn"
-    
-    # Test Info level
-    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Info)
-    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Info, "Level should be Info"
-    
-    # Test Debug level
-    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Debug)
-    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Debug, "Level should be Debug"
-    
-    # Restore original
-    game_audio.AudioManager.set_log_level(original)
+    for level in LOG_LEVELS:
+        game_audio.AudioManager.set_log_level(level)
+        assert game_audio.AudioManager.get_log_level() == level, f"Level should be {level}"
     print("PASS")
 
+@restores_log_level
 def test_logging_output():
     """Test: Logging output works"""
     print("Test: Logging output... ", end="", flush=True)
     
-    original = game_audio.AudioManager.get_log_level()
-    
     # Use AudioSession for proper cleanup
     try:
         session = game_audio.AudioSession()
@@ -51,29 +37,22 @@ def test_logging_output():
         # Test that logging can be enabled and doesn't crash
         game_audio.AudioManager.set_log_level(game_audio.LogLevel.Info)
         
-        # Ensure initialized (AudioSession should handle this, but check to be safe)
-        if not audio.is_initialized():
-            audio.initialize()
+        # AudioSession owns initialization
+        assert audio.is_initialized(), "AudioSession should initialize the system"
         
-        # Create a group (should generate logs)
-        group = audio.create_group()
-        assert group.is_valid(), "Group should be valid"
-        
-        # Set volume (should generate logs at Debug level)
-        audio.set_group_volume(group, 0.5)
-        
-        # Clean up
-        audio.destroy_group(group)
+        # Create a group (should generate logs); destroyed on leaving the block
+        with temp_group(audio) as group:
+            assert group.is_valid(), "Group should be valid"
+            
+            # Set volume (should generate logs at Debug level)
+            audio.set_group_volume(group, 0.5)
         
         # Test that Off disables output
         game_audio.AudioManager.set_log_level(game_audio.LogLevel.Off)
         
         # Operations should still work, just no logging
-        group2 = audio.create_group()
-        audio.destroy_group(group2)
-        
-        # Restore original
-        game_audio.AudioManager.set_log_level(original)
+        with temp_group(audio):
+            pass
     finally:
         # Ensure cleanup
         if 'session' in locals():
@@ -81,6 +60,7 @@ def test_logging_output():
     
     print("PASS")
 
+@restores_log_level
 def test_logging_default_state():
     """Test: Logging defaults to Off"""
     print("Test: Logging default state... ", end="", flush=True)
@@ -93,15 +73,13 @@ def test_logging_default_state():
     # Test that we can enable it
     game_audio.AudioManager.set_log_level(game_audio.LogLevel.Info)
     assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Info, "Should be able to enable logging"
-    
     print("PASS")
 
+@restores_log_level
 def test_logging_persistence():
     """Test: Logging level persists"""
     print("Test: Logging level persistence... ", end="", flush=True)
     
-    original = game_audio.AudioManager.get_log_level()
-    
     # Set a level
     game_audio.AudioManager.set_log_level(game_audio.LogLevel.Warn)
     assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Warn, "Level should persist"
@@ -114,33 +92,31 @@ def test_logging_persistence():
     game_audio.AudioManager.set_log_level(game_audio.LogLevel.Debug)
     assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Debug, "Level should update"
     
-    # Restore original
-    game_audio.AudioManager.set_log_level(original)
+    # Swap sets the new level and hands back the old one
+    previous = game_audio.AudioManager.swap_log_level(game_audio.LogLevel.Error)
+    assert previous == game_audio.LogLevel.Debug, "swap_log_level should return the previous level"
+    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Error, "swap_log_level should set the new level"
     print("PASS")
 
+@restores_log_level
 def test_logging_always_available():
     """Test: Logging is always available (no compile-time flag needed)"""
     print("Test: Logging always available... ", end="", flush=True)
     
-    original = game_audio.AudioManager.get_log_level()
-    
     # Logging should work regardless of how the module was built
     # (In the old system, it would only work if AUDIO_ENABLE_LOGGING was set)
-    # Now it should always work
-    
-    # Test all levels work
-    for level in [game_audio.LogLevel.Off, game_audio.LogLevel.Error, game_audio.LogLevel.Warn, 
-                  game_audio.LogLevel.Info, game_audio.LogLevel.Debug]:
-        game_audio.AudioManager.set_log_level(level)
-        assert game_audio.AudioManager.get_log_level() == level, f"Level {level} should work"
-    
-    # Restore original
-    game_audio.AudioManager.set_log_level(original)
+    # Now it should always work, even before the system is initialized
+    assert not game_audio.AudioManager.get_instance().is_initialized(), \
+        "No test should leave the system initialized"
+    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Debug)
+    assert game_audio.AudioManager.get_log_level() == game_audio.LogLevel.Debug, \
+        "Log level should be settable without an initialized system"
     print("PASS")
 
 def run_all_tests():
     """Run all logging tests"""
     print("=== Python Audio Logging Tests ===\n")
+    quiet_logging()
     
     tests = [
         test_logging_levels,
@@ -150,19 +126,7 @@ def run_all_tests():
         test_logging_always_available,
     ]
     
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except AssertionError as e:
-            print(f"FAIL - {e}")
-            failed += 1
-        except Exception as e:
-            print(f"ERROR - {e}")
-            failed += 1
+    passed, failed = run_tests(tests)
     
     print(f"\n=== Results: {passed} passed, {failed} failed ===")
     return failed == 0
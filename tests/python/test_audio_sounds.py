@@ -28,7 +28,36 @@ def test_sound_loading():
         # Test unloading
         audio.destroy_sound(sound)
         audio.destroy_sound(sound2)
-        assert True, "Sound unloading should not crash"
+    else:
+        print("SKIP (no sound file) ", end="")
+    
+    audio.destroy_group(group)
+    audio.shutdown()
+    print("PASS")
+
+def test_load_sounds_batch():
+    """Test: Loading several sounds in one call"""
+    print("Test: Batch sound loading... ", end="", flush=True)
+    audio = game_audio.AudioManager.get_instance()
+    audio.initialize()
+    
+    group = audio.create_group()
+    
+    if sound_exists("digital_base.wav") and sound_exists("hit.wav"):
+        paths = [get_sound_path("digital_base.wav"), get_sound_path("hit.wav")]
+        sounds = audio.load_sounds(paths, group)
+        assert len(sounds) == 2, "Should return one handle per path"
+        assert all(s.is_valid() for s in sounds), "Batch-loaded sounds should be valid"
+        assert sounds[0] != sounds[1], "Batch-loaded sounds should have distinct handles"
+        for sound in sounds:
+            audio.destroy_sound(sound)
+        
+        # A missing file fails the whole batch
+        try:
+            audio.load_sounds(paths + [get_sound_path("does_not_exist.wav")])
+            assert False, "Batch with a missing file should raise"
+        except game_audio.FileLoadException:
+            pass
     else:
         print("SKIP (no sound file) ", end="")
     
@@ -55,18 +84,15 @@ def test_sound_playback():
         # Note: Sound might finish quickly, so we don't assert it's playing
         
         audio.stop_sound(sound)
-        wait_ms(50)
-        assert not audio.is_sound_playing(sound), "Sound should stop after stop_sound"
+        assert wait_until(lambda: not audio.is_sound_playing(sound)), "Sound should stop after stop_sound"
         
         # Test volume control
         audio.set_sound_volume(sound, 0.5)
-        assert True, "set_sound_volume should not crash"
         
         # Test pitch control
         audio.set_sound_pitch(sound, 1.5)
         audio.play_sound(sound)
         wait_ms(100)
-        assert True, "Pitch modification should work"
         audio.stop_sound(sound)
         
         audio.destroy_sound(sound)
@@ -93,8 +119,6 @@ def test_multiple_instances():
         wait_ms(50)
         audio.play_sound(sound)
         
-        assert True, "Multiple instances should play concurrently"
-        
         wait_ms(200)
         audio.stop_sound(sound)
         audio.destroy_sound(sound)
@@ -104,6 +128,47 @@ def test_multiple_instances():
     audio.shutdown()
     print("PASS")
 
+def test_preload_sound():
+    """Test: Preloading decoded sound data"""
+    print("Test: Sound preloading... ", end="", flush=True)
+    audio = game_audio.AudioManager.get_instance()
+    audio.initialize()
+    
+    group = audio.create_group()
+    
+    if sound_exists("hit.wav"):
+        # Two sounds for the same file share one decoded buffer
+        sound_path = get_sound_path("hit.wav")
+        first = audio.load_sound(sound_path, group)
+        second = audio.load_sound(sound_path, group)
+        audio.preload_sound(first)
+        audio.preload_sound(first)  # Second call is a no-op
+        audio.preload_sound(second)
+        
+        audio.play_sound(first)
+        audio.play_sound(first)
+        assert audio.is_sound_playing(first), "Preloaded sound should play"
+        audio.stop_sound(first)
+        
+        # Releasing one sound must not free the buffer still used by the other
+        audio.destroy_sound(first)
+        audio.play_sound(second)
+        assert audio.is_sound_playing(second), "Shared buffer should survive destroying one sound"
+        audio.stop_sound(second)
+        audio.destroy_sound(second)
+        
+        try:
+            audio.preload_sound(first)
+            assert False, "Preloading a destroyed sound should raise"
+        except game_audio.InvalidHandleException:
+            pass
+    else:
+        print("SKIP (no sound file) ", end="")
+    
+    audio.destroy_group(group)
+    audio.shutdown()
+    print("PASS")
+
 def test_random_sound_folder():
     """Test: Random sound from folder"""
     print("Test: Random sound folder... ", end="", flush=True)
@@ -115,12 +180,10 @@ def test_random_sound_folder():
     # This should load all .wav files from the folder and play one randomly
     audio.play_random_sound_from_folder(SOUND_DIR, group)
     wait_ms(200)
-    assert True, "Random sound playback should work"
     
     # Play again (should use cached sounds)
     audio.play_random_sound_from_folder(SOUND_DIR, group)
     wait_ms(200)
-    assert True, "Cached random sound playback should work"
     
     audio.destroy_group(group)
     
@@ -130,7 +193,6 @@ def test_random_sound_folder():
     group2 = audio.create_group()
     audio.play_random_sound_from_folder(SOUND_DIR, group2)
     wait_ms(200)
-    assert True, "Random sound playback should work after reinitialize"
     audio.destroy_group(group2)
     
     audio.shutdown()
@@ -139,27 +201,18 @@ def test_random_sound_folder():
 def run_all_tests():
     """Run all sound tests"""
     print("=== Python Audio Sound Tests ===\n")
+    quiet_logging()
     
     tests = [
         test_sound_loading,
+        test_load_sounds_batch,
         test_sound_playback,
         test_multiple_instances,
+        test_preload_sound,
         test_random_sound_folder,
     ]
     
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except AssertionError as e:
-            print(f"FAIL - {e}")
-            failed += 1
-        except Exception as e:
-            print(f"ERROR - {e}")
-            failed += 1
+    passed, failed = run_tests(tests, teardown=shutdown_audio)
     
     print(f"\n=== Results: {passed} passed, {failed} failed ===")
     return failed == 0
@@ -6,16 +6,15 @@ and spatial audio integration.
 """
 
 import sys
-import os
-
-# Add build directory to path
-build_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'build', 'Debug')
-if os.path.exists(build_dir):
-    sys.path.insert(0, build_dir)
 
+# test_common puts the build output directories on sys.path
+from test_common import get_sound_path, quiet_logging, wait_until
 import game_audio
 import math
 
+DIGITAL_BASE_PATH = get_sound_path("digital_base.wav")
+HIT_PATH = get_sound_path("hit.wav")
+
 def test_vec3_basic():
     """Test Vec3 basic operations"""
     print("\nTEST: Vec3 Basic Operations")
@@ -36,6 +35,11 @@ def test_vec3_basic():
     assert v1 != v2, "Different Vec3s should compare not equal"
     print("  PASS: Equality comparison")
     
+    # Approximate equality
+    assert v2.allclose(game_audio.Vec3(1.0005, 2.0, 3.0), 0.001), "Vec3s within tolerance should be close"
+    assert not v2.allclose(game_audio.Vec3(1.0, 2.0, 3.1), 0.001), "Vec3s outside tolerance should not be close"
+    print("  PASS: Approximate comparison")
+    
     # Length
     v4 = game_audio.Vec3(3.0, 4.0, 0.0)
     assert abs(v4.length() - 5.0) < 0.001, "Vec3 length should be calculated correctly"
@@ -44,6 +48,14 @@ def test_vec3_basic():
     # Length squared
     assert abs(v4.length_squared() - 25.0) < 0.001, "Vec3 length squared should be correct"
     print("  PASS: Length squared calculation")
+    
+    # Buffer protocol exposes (x, y, z) without copying
+    view = memoryview(v2)
+    assert view.format == 'f' and view.shape == (3,), "Vec3 buffer should be float[3]"
+    assert view.tolist() == [1.0, 2.0, 3.0], "Vec3 buffer should hold x, y, z"
+    view[2] = 9.0
+    assert v2.z == 9.0, "Writes through the buffer should update the Vec3"
+    print("  PASS: Buffer protocol")
 
 def test_vec3_arithmetic():
     """Test Vec3 arithmetic operations"""
@@ -69,7 +81,7 @@ def test_vec3_arithmetic():
     
     # Scalar division
     divided = scaled / 2.0
-    assert abs(divided.x - 1.0) < 0.001 and abs(divided.y - 2.0) < 0.001 and abs(divided.z - 3.0) < 0.001, "Vec3 scalar division should work"
+    assert divided.allclose(game_audio.Vec3(1.0, 2.0, 3.0), 0.001), "Vec3 scalar division should work"
     print("  PASS: Scalar division")
     
     # In-place operations
@@ -79,7 +91,7 @@ def test_vec3_arithmetic():
     print("  PASS: In-place addition")
     
     v3 -= v1
-    assert abs(v3.x - 1.0) < 0.001 and abs(v3.y - 1.0) < 0.001 and abs(v3.z - 1.0) < 0.001, "Vec3 -= should work"
+    assert v3.allclose(game_audio.Vec3(1.0, 1.0, 1.0), 0.001), "Vec3 -= should work"
     print("  PASS: In-place subtraction")
 
 def test_vec3_normalization():
@@ -119,6 +131,14 @@ def test_vec3_distance():
     # Distance to self should be zero
     assert abs(p1.distance(p1)) < 0.001, "Distance to self should be zero"
     print("  PASS: Distance to self is zero")
+    
+    # Batched distances match the per-point method
+    points = [p2, game_audio.Vec3(0.0, 0.0, -2.0), p1]
+    dists = p1.distances(points)
+    assert len(dists) == 3, "Should return one distance per point"
+    assert all(abs(d - p1.distance(p)) < 0.001 for d, p in zip(dists, points)), "Batched distances should match distance()"
+    assert p1.distances([]) == [], "No points should give no distances"
+    print("  PASS: Batched distances")
 
 def test_listener_position():
     """Test listener position management"""
@@ -132,7 +152,7 @@ def test_listener_position():
     audio.set_listener_position(pos1)
     
     retrieved = audio.get_listener_position()
-    assert abs(retrieved.x - 5.0) < 0.01 and abs(retrieved.y - 10.0) < 0.01 and abs(retrieved.z - 15.0) < 0.01, "Listener position should be set correctly"
+    assert retrieved.allclose(pos1, 0.01), "Listener position should be set correctly"
     print("  PASS: Set and get listener position")
     
     # Update position
@@ -168,8 +188,7 @@ def test_sound_position():
     session = game_audio.AudioSession()
     audio = game_audio.AudioManager.get_instance()
     
-    sound_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'sound_files')
-    sound = audio.load_sound(os.path.join(sound_dir, "digital_base.wav"))
+    sound = audio.load_sound(DIGITAL_BASE_PATH)
     assert sound.is_valid(), "Sound should load"
     
     # Set sound position
@@ -177,7 +196,7 @@ def test_sound_position():
     audio.set_sound_position(sound, pos1)
     
     retrieved = audio.get_sound_position(sound)
-    assert abs(retrieved.x - 10.0) < 0.01 and abs(retrieved.y - 20.0) < 0.01 and abs(retrieved.z - 30.0) < 0.01, "Sound position should be set correctly"
+    assert retrieved.allclose(pos1, 0.01), "Sound position should be set correctly"
     print("  PASS: Set and get sound position")
     
     # Update position
@@ -204,8 +223,7 @@ def test_sound_distance_attenuation():
     session = game_audio.AudioSession()
     audio = game_audio.AudioManager.get_instance()
     
-    sound_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'sound_files')
-    sound = audio.load_sound(os.path.join(sound_dir, "digital_base.wav"))
+    sound = audio.load_sound(DIGITAL_BASE_PATH)
     
     # Set min distance
     audio.set_sound_min_distance(sound, 5.0)
@@ -225,6 +243,16 @@ def test_sound_distance_attenuation():
     assert abs(rolloff - 2.0) < 0.01, "Sound rolloff should be set correctly"
     print("  PASS: Set rolloff")
     
+    # Configure everything in one call
+    audio.configure_sound_spatial(sound, 2.0, 40.0, 1.5, game_audio.Vec3(1.0, 2.0, 3.0))
+    assert abs(audio.get_sound_min_distance(sound) - 2.0) < 0.01, "Min distance should be configured"
+    assert abs(audio.get_sound_max_distance(sound) - 40.0) < 0.01, "Max distance should be configured"
+    assert abs(audio.get_sound_rolloff(sound) - 1.5) < 0.01, "Rolloff should be configured"
+    assert audio.get_sound_position(sound) == game_audio.Vec3(1.0, 2.0, 3.0), "Position should be configured"
+    audio.configure_sound_spatial(sound, min_distance=1.0, max_distance=20.0, rolloff=1.0)
+    assert audio.get_sound_position(sound) == game_audio.Vec3(1.0, 2.0, 3.0), "Omitted position should be unchanged"
+    print("  PASS: Configure spatial parameters in one call")
+    
     audio.destroy_sound(sound)
     session.close()
 
@@ -235,8 +263,7 @@ def test_sound_spatialization_enabled():
     session = game_audio.AudioSession()
     audio = game_audio.AudioManager.get_instance()
     
-    sound_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'sound_files')
-    sound = audio.load_sound(os.path.join(sound_dir, "digital_base.wav"))
+    sound = audio.load_sound(DIGITAL_BASE_PATH)
     
     # Spatialization should be enabled by default
     enabled = audio.is_sound_spatialization_enabled(sound)
@@ -270,8 +297,7 @@ def test_spatial_audio_integration():
     audio.set_listener_position(listener_pos)
     
     # Create sound at a distance
-    sound_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'sound_files')
-    sound = audio.load_sound(os.path.join(sound_dir, "digital_base.wav"))
+    sound = audio.load_sound(DIGITAL_BASE_PATH)
     sound_pos = game_audio.Vec3(5.0, 0.0, 0.0)  # 5 units to the right
     audio.set_sound_position(sound, sound_pos)
     audio.set_sound_min_distance(sound, 1.0)
@@ -303,37 +329,31 @@ def test_play_sound_at_position():
     audio.set_listener_position(game_audio.Vec3(0.0, 0.0, 0.0))
     
     # Load a sound
-    sound_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'sound_files')
-    sound = audio.load_sound(os.path.join(sound_dir, "digital_base.wav"))
+    sound = audio.load_sound(DIGITAL_BASE_PATH)
     audio.set_sound_min_distance(sound, 1.0)
     audio.set_sound_max_distance(sound, 20.0)
     
     # Play at position 1
     pos1 = game_audio.Vec3(5.0, 0.0, 0.0)
     audio.play_sound(sound, pos1)
-    import time
-    time.sleep(0.1)
-    assert audio.is_sound_playing(sound), "Sound should be playing at position 1"
+    assert wait_until(lambda: audio.is_sound_playing(sound)), "Sound should be playing at position 1"
     print("  PASS: Sound plays at position 1")
     
     # Play at position 2 (should overlap with position 1)
     pos2 = game_audio.Vec3(10.0, 0.0, 0.0)
     audio.play_sound(sound, pos2)
-    time.sleep(0.1)
-    assert audio.is_sound_playing(sound), "Sound should still be playing (overlapping instances)"
+    assert wait_until(lambda: audio.is_sound_playing(sound)), "Sound should still be playing (overlapping instances)"
     print("  PASS: Overlapping sounds work correctly")
     
     # Play at position 3 (should overlap with both)
     pos3 = game_audio.Vec3(-5.0, 0.0, 0.0)
     audio.play_sound(sound, pos3)
-    time.sleep(0.1)
-    assert audio.is_sound_playing(sound), "Sound should still be playing (multiple overlapping instances)"
+    assert wait_until(lambda: audio.is_sound_playing(sound)), "Sound should still be playing (multiple overlapping instances)"
     print("  PASS: Multiple overlapping instances work")
     
     # Stop all instances
     audio.stop_sound(sound)
-    time.sleep(0.1)
-    assert not audio.is_sound_playing(sound), "All instances should be stopped"
+    assert wait_until(lambda: not audio.is_sound_playing(sound)), "All instances should be stopped"
     print("  PASS: All instances stopped correctly")
     
     audio.destroy_sound(sound)
@@ -350,8 +370,7 @@ def test_overlapping_spatial_sounds():
     audio.set_listener_position(game_audio.Vec3(0.0, 0.0, 0.0))
     
     # Load a sound
-    sound_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'sound_files')
-    sound = audio.load_sound(os.path.join(sound_dir, "digital_base.wav"))
+    sound = audio.load_sound(DIGITAL_BASE_PATH)
     audio.set_sound_min_distance(sound, 1.0)
     audio.set_sound_max_distance(sound, 50.0)
     
@@ -367,13 +386,112 @@ def test_overlapping_spatial_sounds():
     for pos in positions:
         audio.play_sound(sound, pos)
     
-    import time
-    time.sleep(0.2)
-    assert audio.is_sound_playing(sound), "All instances should be playing simultaneously"
+    assert wait_until(lambda: audio.is_sound_playing(sound)), "All instances should be playing simultaneously"
     print("  PASS: Multiple overlapping spatial sounds play correctly")
     
     audio.stop_sound(sound)
-    time.sleep(0.1)
+    
+    audio.destroy_sound(sound)
+    session.close()
+
+def test_play_sound_batch():
+    """Test playing a sound at several positions in one call"""
+    print("\nTEST: Play Sound Batch at Multiple Positions")
+    
+    session = game_audio.AudioSession()
+    audio = game_audio.AudioManager.get_instance()
+    
+    audio.set_listener_position(game_audio.Vec3(0.0, 0.0, 0.0))
+    
+    sound = audio.load_sound(DIGITAL_BASE_PATH)
+    
+    positions = [
+        game_audio.Vec3(5.0, 0.0, 0.0),
+        game_audio.Vec3(-5.0, 0.0, 0.0),
+        game_audio.Vec3(0.0, 0.0, 5.0)
+    ]
+    
+    audio.play_sound_batch(sound, positions)
+    assert wait_until(lambda: audio.is_sound_playing(sound)), "Batched instances should be playing"
+    print("  PASS: Batched instances play")
+    
+    audio.stop_sound(sound)
+    assert wait_until(lambda: not audio.is_sound_playing(sound)), "All batched instances should be stopped"
+    print("  PASS: Batched instances stop together")
+    
+    try:
+        audio.play_sound_batch(game_audio.SoundHandle(99999), positions)
+        assert False, "Batch with invalid handle should raise"
+    except game_audio.InvalidHandleException:
+        print("  PASS: Invalid handle raises InvalidHandleException")
+    
+    import array
+    packed = array.array('f', [5.0, 0.0, 0.0, -5.0, 0.0, 0.0, 0.0, 0.0, 5.0])
+    audio.play_sound_batch(sound, packed)
+    assert wait_until(lambda: audio.is_sound_playing(sound)), "Packed float32 positions should play"
+    audio.stop_sound(sound)
+    audio.play_sound_batch(sound, memoryview(packed).cast('B').cast('f', [3, 3]))
+    audio.stop_sound(sound)
+    print("  PASS: Packed float32 buffers accepted")
+    
+    # ctypes exports its arrays with an explicit byte-order prefix ("<f")
+    import ctypes
+    prefixed = (ctypes.c_float * 6)(5.0, 0.0, 0.0, -5.0, 0.0, 0.0)
+    assert memoryview(prefixed).format != 'f', "ctypes buffer should carry a byte-order prefix"
+    audio.play_sound_batch(sound, prefixed)
+    assert wait_until(lambda: audio.is_sound_playing(sound)), "Byte-order-prefixed float32 positions should play"
+    audio.stop_sound(sound)
+    print("  PASS: Byte-order-prefixed float32 buffers accepted")
+    
+    try:
+        audio.play_sound_batch(sound, array.array('d', [1.0, 2.0, 3.0]))
+        assert False, "Non-float32 buffer should raise"
+    except TypeError:
+        print("  PASS: Non-float32 buffer raises TypeError")
+    
+    try:
+        audio.play_sound_batch(sound, array.array('f', [1.0, 2.0]))
+        assert False, "Buffer that is not whole triples should raise"
+    except ValueError:
+        print("  PASS: Partial triple raises ValueError")
+    
+    audio.destroy_sound(sound)
+    session.close()
+
+def test_schedule_play_sound():
+    """Test scheduling a positioned sound with a delay"""
+    print("\nTEST: Schedule Sound at Position with Delay")
+    
+    import time
+    from datetime import timedelta
+    
+    session = game_audio.AudioSession()
+    audio = game_audio.AudioManager.get_instance()
+    
+    audio.set_listener_position(game_audio.Vec3(0.0, 0.0, 0.0))
+    
+    sound = audio.load_sound(DIGITAL_BASE_PATH)
+    
+    audio.schedule_play_sound(sound, game_audio.Vec3(5.0, 0.0, 0.0), timedelta(milliseconds=150))
+    assert audio.is_sound_playing(sound), "A pending instance should count as playing"
+    audio.schedule_play_sound(sound, game_audio.Vec3(-5.0, 0.0, 0.0), timedelta(milliseconds=300))
+    assert audio.is_sound_playing(sound), "Scheduled instances should count as playing"
+    print("  PASS: Scheduled instances are live immediately")
+    
+    assert audio.get_sound_instance_count(sound) == 2, "Both pending instances should survive the second schedule"
+    time.sleep(0.4)
+    assert audio.get_sound_instance_count(sound) == 2, "Both scheduled instances should have started"
+    print("  PASS: Earlier scheduled instances survive later schedule calls")
+    
+    audio.stop_sound(sound)
+    assert wait_until(lambda: not audio.is_sound_playing(sound)), "Stopping should cancel scheduled instances"
+    print("  PASS: Stopping cancels scheduled instances")
+    
+    try:
+        audio.schedule_play_sound(sound, game_audio.Vec3(), timedelta(milliseconds=-1))
+        assert False, "Negative delay should raise"
+    except game_audio.AudioException:
+        print("  PASS: Negative delay raises AudioException")
     
     audio.destroy_sound(sound)
     session.close()
@@ -390,13 +508,17 @@ def test_random_container_get_random_sound():
     container = game_audio.RandomSoundContainer("test_container", config)
     
     # Add multiple sounds
-    sound_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'sound_files')
-    container.add_sound(os.path.join(sound_dir, "digital_base.wav"))
-    container.add_sound(os.path.join(sound_dir, "hit.wav"))
+    container.add_sound(DIGITAL_BASE_PATH)
+    container.add_sound(HIT_PATH)
     
     assert container.get_sound_count() == 2, "Container should have 2 sounds"
     print("  PASS: Container has correct sound count")
     
+    handles = container.get_sounds()
+    assert len(handles) == 2 and handles[0] != handles[1], "get_sounds should return each loaded handle"
+    assert container.get_random_sound() in handles, "Random sound should be one of the container's handles"
+    print("  PASS: get_sounds returns loaded handles")
+    
     # Get random sounds multiple times
     sound1 = container.get_random_sound()
     assert sound1.value != 0, "GetRandomSound should return valid handle"
@@ -414,12 +536,70 @@ def test_random_container_get_random_sound():
     
     session.close()
 
+def test_random_container_spatial_config():
+    """Test RandomSoundContainer applies spatial settings when sounds are loaded"""
+    print("\nTEST: RandomSoundContainer Spatial Config")
+    
+    session = game_audio.AudioSession()
+    audio = game_audio.AudioManager.get_instance()
+    
+    config = game_audio.RandomSoundContainerConfig()
+    config.min_distance = 2.0
+    config.max_distance = 30.0
+    config.rolloff = 1.5
+    container = game_audio.RandomSoundContainer("spatial_container", config)
+    
+    container.add_sound(HIT_PATH)
+    
+    sound = container.get_random_sound()
+    assert abs(audio.get_sound_min_distance(sound) - 2.0) < 0.001, "Min distance should be applied on load"
+    assert abs(audio.get_sound_max_distance(sound) - 30.0) < 0.001, "Max distance should be applied on load"
+    assert abs(audio.get_sound_rolloff(sound) - 1.5) < 0.001, "Rolloff should be applied on load"
+    print("  PASS: Spatial settings applied on load")
+    
+    session.close()
+
+def test_random_container_folder_with_bad_file():
+    """Test RandomSoundContainer folder loading keeps the good files when one fails"""
+    print("\nTEST: RandomSoundContainer Folder With Bad File")
+    import os
+    import shutil
+    import tempfile
+    
+    session = game_audio.AudioSession()
+    
+    config = game_audio.RandomSoundContainerConfig()
+    container = game_audio.RandomSoundContainer("folder_container", config)
+    container.add_sound(HIT_PATH)
+    
+    with tempfile.TemporaryDirectory() as folder:
+        shutil.copy(DIGITAL_BASE_PATH, os.path.join(folder, "good.wav"))
+        with open(os.path.join(folder, "bad.wav"), "wb") as bad_file:
+            bad_file.write(b"not a wav file")
+        
+        try:
+            container.load_from_folder(folder)
+            assert False, "load_from_folder should raise for an undecodable file"
+        except game_audio.FileLoadException as e:
+            assert "bad.wav" in str(e), "Exception should name the bad file"
+        print("  PASS: Bad file raises FileLoadException naming it")
+    
+    assert container.get_sound_count() == 2, "Good file should be added alongside earlier sounds"
+    print("  PASS: Earlier sounds and the folder's good files kept")
+    
+    session.close()
+
 def main():
     """Run all spatial audio tests"""
     print("========================================")
     print("Python Spatial Audio Tests")
     print("========================================")
+    quiet_logging()
     
+    # One session for the whole run: the per-test sessions then find the
+    # system already initialized and leave it running, so the audio device
+    # is opened once instead of once per test
+    session = game_audio.AudioSession()
     try:
         test_vec3_basic()
         test_vec3_arithmetic()
@@ -433,7 +613,11 @@ def main():
         test_spatial_audio_integration()
         test_play_sound_at_position()
         test_overlapping_spatial_sounds()
+        test_play_sound_batch()
+        test_schedule_play_sound()
         test_random_container_get_random_sound()
+        test_random_container_spatial_config()
+        test_random_container_folder_with_bad_file()
         
         print("\n========================================")
         print("ALL TESTS PASSED OK")
@@ -446,6 +630,8 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        session.close()
 
 if __name__ == "__main__":
     sys.exit(main())
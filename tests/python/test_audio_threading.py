@@ -18,41 +18,42 @@ def test_thread_safety_get_master_volume():
     # Launch multiple threads that call get_master_volume concurrently
     num_threads = 10
     calls_per_thread = 100
-    success_count = [0]
-    failure_count = [0]
-    lock = threading.Lock()
+    # Each worker tallies locally and writes its own slot, so no lock is needed
+    results = [(0, 0)] * num_threads
     
-    def worker():
+    def worker(index):
+        successes = failures = 0
         for _ in range(calls_per_thread):
             try:
                 vol = audio.get_master_volume()
                 if 0.0 <= vol <= 1.0:
-                    with lock:
-                        success_count[0] += 1
+                    successes += 1
                 else:
-                    with lock:
-                        failure_count[0] += 1
+                    failures += 1
             except Exception:
-                with lock:
-                    failure_count[0] += 1
+                failures += 1
+        results[index] = (successes, failures)
     
     threads = []
-    for _ in range(num_threads):
-        t = threading.Thread(target=worker)
+    for i in range(num_threads):
+        t = threading.Thread(target=worker, args=(i,))
         t.start()
         threads.append(t)
     
-    # Also change volume from main thread while reading
-    for i in range(50):
-        audio.set_master_volume(0.3 + (i % 2) * 0.4)
-        wait_ms(10)
+    # Also change volume from main thread for as long as the readers run
+    writes = 0
+    while any(t.is_alive() for t in threads):
+        audio.set_master_volume(0.3 + (writes % 2) * 0.4)
+        writes += 1
     
     # Wait for all threads
     for t in threads:
         t.join()
     
-    assert success_count[0] > 0, "get_master_volume should succeed from multiple threads"
-    assert failure_count[0] == 0, "get_master_volume should not fail or crash"
+    success_count = sum(successes for successes, _ in results)
+    failure_count = sum(failures for _, failures in results)
+    assert success_count > 0, "get_master_volume should succeed from multiple threads"
+    assert failure_count == 0, "get_master_volume should not fail or crash"
     
     # Reset volume
     audio.set_master_volume(1.0)
@@ -79,9 +80,10 @@ def test_concurrent_operations():
         audio.set_group_volume(sfx, 0.6)
         audio.fade_group(music, 0.3, timedelta(milliseconds=500))
         
-        wait_ms(600)
-        
-        assert True, "Concurrent operations should work"
+        assert wait_until(lambda: isclose(audio.get_group_volume(music), 0.3, abs_tol=0.01)), \
+            "Group fade should complete alongside playback"
+        assert isclose(audio.get_group_volume(sfx), 0.6, abs_tol=0.01), \
+            "Unfaded group should keep its volume"
         
         audio.stop_sound(sound1)
         audio.stop_sound(sound2)
@@ -96,25 +98,14 @@ def test_concurrent_operations():
 def run_all_tests():
     """Run all threading tests"""
     print("=== Python Audio Threading Tests ===\n")
+    quiet_logging()
     
     tests = [
         test_thread_safety_get_master_volume,
         test_concurrent_operations,
     ]
     
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except AssertionError as e:
-            print(f"FAIL - {e}")
-            failed += 1
-        except Exception as e:
-            print(f"ERROR - {e}")
-            failed += 1
+    passed, failed = run_tests(tests, teardown=shutdown_audio)
     
     print(f"\n=== Results: {passed} passed, {failed} failed ===")
     return failed == 0
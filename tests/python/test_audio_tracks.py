@@ -19,31 +19,28 @@ def test_track_operations():
         # Add layers
         audio.add_layer(track, "layer1", get_sound_path("digital_base.wav"))
         audio.add_layer(track, "layer2", get_sound_path("digital_battle.wav"))
-        assert True, "Layers should be added without error"
         
         # Set layer volumes
         audio.set_layer_volume(track, "layer1", 1.0)
         audio.set_layer_volume(track, "layer2", 0.0)
-        assert True, "Layer volumes should be set"
+        assert isclose(audio.get_layer_volume(track, "layer1"), 1.0, abs_tol=0.01), "layer1 volume should be set"
+        assert audio.get_layer_volume(track, "layer2") == 0.0, "layer2 volume should be set"
         
         # Play track
         audio.play_track(track)
         wait_ms(200)
-        assert True, "Track should play"
         
         # Test layer fade
         audio.fade_layer(track, "layer2", 1.0, timedelta(milliseconds=300))
-        wait_ms(350)
-        assert True, "Layer fade should complete"
+        assert wait_until(lambda: isclose(audio.get_layer_volume(track, "layer2"), 1.0, abs_tol=0.01)), \
+            "Layer fade should complete"
         
         # Stop track
         audio.stop_track(track)
         wait_ms(50)
-        assert True, "Track should stop"
         
         # Remove layer
         audio.remove_layer(track, "layer1")
-        assert True, "Layer removal should not crash"
     else:
         print("SKIP (no sound files) ", end="")
     
@@ -73,11 +70,57 @@ def test_audio_track_update_fix():
         audio.fade_layer(track, "layer1", 1.0, timedelta(milliseconds=500))
         audio.fade_layer(track, "layer2", 0.5, timedelta(milliseconds=300))
         
-        # Wait for fades to complete
-        wait_ms(600)
+        # Verify volumes are set correctly once the fades complete
+        assert wait_until(lambda: isclose(audio.get_layer_volume(track, "layer1"), 1.0, abs_tol=0.01)), \
+            "layer1 fade should complete"
+        assert isclose(audio.get_layer_volume(track, "layer2"), 0.5, abs_tol=0.01), \
+            "layer2 fade should complete"
         
-        # Verify volumes are set correctly (fade should have completed)
-        assert True, "Fade operations should complete without issues"
+        audio.stop_track(track)
+        audio.destroy_track(track)
+    else:
+        print("SKIP (no sound files) ", end="")
+    
+    audio.shutdown()
+    print("PASS")
+
+def test_fade_layers():
+    """Test: Fade several layers in one call"""
+    print("Test: Fade multiple layers... ", end="", flush=True)
+    audio = game_audio.AudioManager.get_instance()
+    audio.initialize()
+    
+    if sound_exists("digital_base.wav") and sound_exists("digital_battle.wav"):
+        track = audio.create_track()
+        audio.add_layer(track, "layer1", get_sound_path("digital_base.wav"))
+        audio.add_layer(track, "layer2", get_sound_path("digital_battle.wav"))
+        audio.set_layer_volume(track, "layer1", 1.0)
+        audio.set_layer_volume(track, "layer2", 0.0)
+        audio.play_track(track)
+        
+        # Crossfade both layers in one call
+        audio.fade_layers(track, {"layer1": 0.0, "layer2": 1.0}, timedelta(milliseconds=300))
+        assert wait_until(lambda: isclose(audio.get_layer_volume(track, "layer2"), 1.0, abs_tol=0.01)), \
+            "Crossfade should complete"
+        assert isclose(audio.get_layer_volume(track, "layer1"), 0.0, abs_tol=0.01), \
+            "Both layers should fade together"
+        
+        # A float duration is taken as seconds
+        audio.fade_layers(track, {"layer1": 1.0, "layer2": 0.0}, 0.3)
+        audio.fade_layer(track, "layer2", 0.5, 0.3)
+        assert wait_until(lambda: isclose(audio.get_layer_volume(track, "layer2"), 0.5, abs_tol=0.01)), \
+            "Float-seconds fade should complete"
+        
+        # Durations have millisecond resolution; a positive sub-millisecond one becomes 1 ms
+        audio.fade_layer(track, "layer2", 0.25, 0.0004)
+        assert wait_until(lambda: isclose(audio.get_layer_volume(track, "layer2"), 0.25, abs_tol=0.01)), \
+            "Sub-millisecond fade should complete instead of raising"
+        
+        try:
+            audio.fade_layers(track, {"layer1": 1.0}, timedelta(0))
+            assert False, "Zero fade duration should raise"
+        except game_audio.AudioException:
+            pass
         
         audio.stop_track(track)
         audio.destroy_track(track)
@@ -90,25 +133,15 @@ def test_audio_track_update_fix():
 def run_all_tests():
     """Run all track tests"""
     print("=== Python Audio Track Tests ===\n")
+    quiet_logging()
     
     tests = [
         test_track_operations,
         test_audio_track_update_fix,
+        test_fade_layers,
     ]
     
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except AssertionError as e:
-            print(f"FAIL - {e}")
-            failed += 1
-        except Exception as e:
-            print(f"ERROR - {e}")
-            failed += 1
+    passed, failed = run_tests(tests, teardown=shutdown_audio)
     
     print(f"\n=== Results: {passed} passed, {failed} failed ===")
     return failed == 0
@@ -5,6 +5,9 @@ Tests input validation, error handling, and exception types.
 
 from test_common import *
 
+DIGITAL_BASE_PATH = get_sound_path("digital_base.wav")
+HIT_PATH = get_sound_path("hit.wav")
+
 def test_not_initialized():
     """Test: Using API without initialize should raise NotInitializedException"""
     print("Test: Not initialized... ", end="", flush=True)
@@ -28,15 +31,12 @@ def test_audio_session_lifecycle():
     audio = game_audio.AudioManager.get_instance()
     audio.shutdown()
 
-    session = game_audio.AudioSession()
-    try:
-        audio.set_master_volume(0.5)
-    except Exception as e:
-        print(f"FAIL - Unexpected exception after session init: {type(e).__name__}: {e}")
-        session.close()
-        return False
-
-    session.close()
+    with game_audio.AudioSession():
+        try:
+            audio.set_master_volume(0.5)
+        except Exception as e:
+            print(f"FAIL - Unexpected exception after session init: {type(e).__name__}: {e}")
+            return False
 
     try:
         audio.set_master_volume(0.5)
@@ -49,101 +49,71 @@ def test_audio_session_lifecycle():
         print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
         return False
 
-def test_invalid_track_handle():
-    """Test: Using invalid track handle should raise InvalidHandleException"""
-    print("Test: Invalid track handle... ", end="", flush=True)
+def test_invalid_handles():
+    """Test: Using invalid handles should raise InvalidHandleException"""
+    print("Test: Invalid handles... ", end="", flush=True)
     audio = game_audio.AudioManager.get_instance()
-    audio.initialize()
     
-    try:
-        audio.play_track(game_audio.TrackHandle(99999))
-        print("FAIL - No exception raised")
-        audio.shutdown()
-        return False
-    except game_audio.InvalidHandleException:
-        print("PASS")
-        audio.shutdown()
-        return True
-    except Exception as e:
-        print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
-        audio.shutdown()
-        return False
-
-def test_invalid_sound_handle():
-    """Test: Using invalid sound handle should raise InvalidHandleException"""
-    print("Test: Invalid sound handle... ", end="", flush=True)
-    audio = game_audio.AudioManager.get_instance()
-    audio.initialize()
+    bad_track = game_audio.TrackHandle(99999)
+    bad_sound = game_audio.SoundHandle(99999)
+    bad_group = game_audio.GroupHandle(99999)
+    cases = [
+        ("play_track", lambda: audio.play_track(bad_track)),
+        ("stop_track", lambda: audio.stop_track(bad_track)),
+        ("add_layer", lambda: audio.add_layer(bad_track, "layer", HIT_PATH)),
+        ("play_sound", lambda: audio.play_sound(bad_sound)),
+        ("stop_sound", lambda: audio.stop_sound(bad_sound)),
+        ("set_sound_volume", lambda: audio.set_sound_volume(bad_sound, 0.5)),
+        ("set_group_volume", lambda: audio.set_group_volume(bad_group, 0.5)),
+    ]
     
-    try:
-        audio.play_sound(game_audio.SoundHandle(99999))
-        print("FAIL - No exception raised")
-        audio.shutdown()
-        return False
-    except game_audio.InvalidHandleException:
-        print("PASS")
-        audio.shutdown()
-        return True
-    except Exception as e:
-        print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
-        audio.shutdown()
-        return False
-
-def test_invalid_group_handle():
-    """Test: Using invalid group handle should raise InvalidHandleException"""
-    print("Test: Invalid group handle... ", end="", flush=True)
-    audio = game_audio.AudioManager.get_instance()
-    audio.initialize()
+    for name, call in cases:
+        try:
+            call()
+            print(f"FAIL - No exception raised by {name}")
+            return False
+        except game_audio.InvalidHandleException:
+            pass
+        except Exception as e:
+            print(f"FAIL - Wrong exception type from {name}: {type(e).__name__}: {e}")
+            return False
     
-    try:
-        audio.set_group_volume(game_audio.GroupHandle(99999), 0.5)
-        print("FAIL - No exception raised")
-        audio.shutdown()
-        return False
-    except game_audio.InvalidHandleException:
-        print("PASS")
-        audio.shutdown()
-        return True
-    except Exception as e:
-        print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
-        audio.shutdown()
-        return False
+    print("PASS")
+    return True
 
 def test_file_not_found():
     """Test: Loading non-existent file should raise FileLoadException"""
     print("Test: File not found... ", end="", flush=True)
     audio = game_audio.AudioManager.get_instance()
-    audio.initialize()
     
     try:
         audio.load_sound("nonexistent_file.mp3")
         print("FAIL - No exception raised")
-        audio.shutdown()
         return False
     except game_audio.FileLoadException:
         print("PASS")
-        audio.shutdown()
         return True
     except Exception as e:
         print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
-        audio.shutdown()
         return False
 
 def test_sound_playback_initialization_failure():
     """Test: Sound playback initialization failure handling"""
     print("Test: Sound playback initialization failure... ", end="", flush=True)
     audio = game_audio.AudioManager.get_instance()
-    audio.initialize()
     
     try:
         # Test that valid sounds play correctly (regression test)
         # This verifies our fix doesn't break normal operation
         if sound_exists("digital_base.wav"):
-            sound = audio.load_sound(get_sound_path("digital_base.wav"))
+            sound = audio.load_sound(DIGITAL_BASE_PATH)
             audio.play_sound(sound)
-            wait_ms(50)
+            started = wait_until(lambda: audio.is_sound_playing(sound))
             audio.stop_sound(sound)
             audio.destroy_sound(sound)
+            if not started:
+                print("FAIL - Valid sound did not start playing")
+                return False
             
             # Verify exception hierarchy - FileLoadException should be catchable as AudioException
             # Note: In practice, ma_sound_init_from_file() can fail if:
@@ -154,85 +124,61 @@ def test_sound_playback_initialization_failure():
             # If such a failure occurs, PlaySound() will throw FileLoadException
             
             # Test that FileLoadException can be caught as AudioException (hierarchy test)
-            sound2 = audio.load_sound(get_sound_path("digital_base.wav"))
+            sound2 = audio.load_sound(DIGITAL_BASE_PATH)
             try:
                 audio.play_sound(sound2)
-                wait_ms(50)
                 audio.stop_sound(sound2)
-                audio.destroy_sound(sound2)
                 
                 # If we get here, playback succeeded (expected for valid files)
                 print("PASS")
-                audio.shutdown()
                 return True
             except game_audio.FileLoadException as e:
                 # If FileLoadException is thrown, verify it has useful information
                 msg = str(e)
                 if "file" in msg.lower() or "playback" in msg.lower() or "initialize" in msg.lower():
                     print("PASS (exception with descriptive message)")
-                    audio.destroy_sound(sound2)
-                    audio.shutdown()
                     return True
                 else:
                     print(f"FAIL - Exception message not descriptive: {msg}")
-                    audio.destroy_sound(sound2)
-                    audio.shutdown()
                     return False
             except game_audio.AudioException:
                 # FileLoadException should be catchable as AudioException
                 print("PASS (exception caught as AudioException)")
-                audio.destroy_sound(sound2)
-                audio.shutdown()
                 return True
+            finally:
+                audio.destroy_sound(sound2)
         else:
             print("SKIP - Test sound file not found")
-            audio.shutdown()
             return True
     except Exception as e:
         print(f"FAIL - Unexpected exception: {type(e).__name__}: {e}")
-        audio.shutdown()
         return False
 
 def test_fade_duration_validation():
     """Test: Fade duration validation"""
     print("Test: Fade duration validation... ", end="", flush=True)
     audio = game_audio.AudioManager.get_instance()
-    audio.initialize()
     
     group = audio.create_group()
+    cases = [
+        ("negative duration", timedelta(milliseconds=-100)),
+        ("zero duration", timedelta(milliseconds=0)),
+    ]
     
-    # Test negative duration
-    try:
-        audio.fade_group(group, 0.5, timedelta(milliseconds=-100))
-        print("FAIL - No exception for negative duration")
-        audio.destroy_group(group)
-        audio.shutdown()
-        return False
-    except game_audio.AudioException:
-        pass  # Expected
-    except Exception as e:
-        print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
-        audio.destroy_group(group)
-        audio.shutdown()
-        return False
-    
-    # Test zero duration
     try:
-        audio.fade_group(group, 0.5, timedelta(milliseconds=0))
-        print("FAIL - No exception for zero duration")
-        audio.destroy_group(group)
-        audio.shutdown()
-        return False
-    except game_audio.AudioException:
-        pass  # Expected
-    except Exception as e:
-        print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
+        for name, duration in cases:
+            try:
+                audio.fade_group(group, 0.5, duration)
+                print(f"FAIL - No exception for {name}")
+                return False
+            except game_audio.AudioException:
+                pass  # Expected
+            except Exception as e:
+                print(f"FAIL - Wrong exception type for {name}: {type(e).__name__}: {e}")
+                return False
+    finally:
         audio.destroy_group(group)
-        audio.shutdown()
-        return False
     
-    audio.destroy_group(group)
-    audio.shutdown()
     print("PASS")
     return True
 
@@ -240,58 +186,29 @@ def test_input_validation():
     """Test: Input validation for layer names and paths"""
     print("Test: Input validation... ", end="", flush=True)
     audio = game_audio.AudioManager.get_instance()
-    audio.initialize()
     
     track = audio.create_track()
+    cases = [
+        ("empty filepath", lambda: audio.add_layer(track, "layer1", "")),
+        ("empty folder path", lambda: audio.play_random_sound_from_folder("", game_audio.GroupHandle(0))),
+    ]
+    if sound_exists("digital_base.wav"):
+        cases.insert(0, ("empty layer name", lambda: audio.add_layer(track, "", DIGITAL_BASE_PATH)))
     
-    # Test empty layer name
-    try:
-        if sound_exists("digital_base.wav"):
-            audio.add_layer(track, "", get_sound_path("digital_base.wav"))
-            print("FAIL - No exception for empty layer name")
-            audio.destroy_track(track)
-            audio.shutdown()
-            return False
-    except game_audio.AudioException:
-        pass  # Expected
-    except Exception as e:
-        print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
-        audio.destroy_track(track)
-        audio.shutdown()
-        return False
-    
-    # Test empty filepath
-    try:
-        audio.add_layer(track, "layer1", "")
-        print("FAIL - No exception for empty filepath")
-        audio.destroy_track(track)
-        audio.shutdown()
-        return False
-    except game_audio.AudioException:
-        pass  # Expected
-    except Exception as e:
-        print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
-        audio.destroy_track(track)
-        audio.shutdown()
-        return False
-    
-    # Test empty folder path
     try:
-        audio.play_random_sound_from_folder("", game_audio.GroupHandle(0))
-        print("FAIL - No exception for empty folder path")
-        audio.destroy_track(track)
-        audio.shutdown()
-        return False
-    except game_audio.AudioException:
-        pass  # Expected
-    except Exception as e:
-        print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
+        for name, call in cases:
+            try:
+                call()
+                print(f"FAIL - No exception for {name}")
+                return False
+            except game_audio.AudioException:
+                pass  # Expected
+            except Exception as e:
+                print(f"FAIL - Wrong exception type for {name}: {type(e).__name__}: {e}")
+                return False
+    finally:
         audio.destroy_track(track)
-        audio.shutdown()
-        return False
     
-    audio.destroy_track(track)
-    audio.shutdown()
     print("PASS")
     return True
 
@@ -299,33 +216,40 @@ def test_exception_hierarchy():
     """Test: Exception type hierarchy"""
     print("Test: Exception hierarchy... ", end="", flush=True)
     audio = game_audio.AudioManager.get_instance()
-    audio.initialize()
+    
+    # Every specific exception type is exposed and derives from AudioException
+    for name in ("InvalidHandleException", "FileLoadException", "NotInitializedException"):
+        exception_type = getattr(game_audio, name, None)
+        if exception_type is None or not issubclass(exception_type, game_audio.AudioException):
+            print(f"FAIL - {name} should be exposed as a subclass of AudioException")
+            return False
     
     # Test that specific exceptions can be caught as AudioException
     try:
         audio.play_track(game_audio.TrackHandle(0))
         print("FAIL - Expected exception to be thrown")
-        audio.shutdown()
         return False
     except game_audio.AudioException:
         print("PASS")
-        audio.shutdown()
         return True
     except Exception as e:
         print(f"FAIL - Wrong exception type: {type(e).__name__}: {e}")
-        audio.shutdown()
         return False
 
 def run_all_tests():
     """Run all validation tests"""
     print("=== Python Audio Validation Tests ===\n")
+    quiet_logging()
     
-    tests = [
+    # These manage initialization themselves and leave the system shut down
+    lifecycle_tests = [
         test_not_initialized,
         test_audio_session_lifecycle,
-        test_invalid_track_handle,
-        test_invalid_sound_handle,
-        test_invalid_group_handle,
+    ]
+    
+    # These only need an initialized system, so they share one session
+    session_tests = [
+        test_invalid_handles,
         test_file_not_found,
         test_sound_playback_initialization_failure,
         test_fade_duration_validation,
@@ -336,15 +260,21 @@ def run_all_tests():
     passed = 0
     failed = 0
     
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
+    def run(tests):
+        nonlocal passed, failed
+        for test in tests:
+            try:
+                if test():
+                    passed += 1
+                else:
+                    failed += 1
+            except Exception as e:
+                print(f"ERROR - {e}")
                 failed += 1
-        except Exception as e:
-            print(f"ERROR - {e}")
-            failed += 1
+    
+    run(lifecycle_tests)
+    with game_audio.AudioSession():
+        run(session_tests)
     
     print(f"\n=== Results: {passed} passed, {failed} failed ===")
     return failed == 0
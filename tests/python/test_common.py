@@ -16,19 +16,95 @@ for path in (build_release, build_debug, build_root):
         sys.path.insert(0, path)
 
 import game_audio
+from contextlib import contextmanager
+from functools import wraps
 from datetime import timedelta
+from math import isclose
 import time
 
+# Every log level, from least to most verbose
+LOG_LEVELS = (game_audio.LogLevel.Off, game_audio.LogLevel.Error, game_audio.LogLevel.Warn,
+              game_audio.LogLevel.Info, game_audio.LogLevel.Debug)
+
 SOUND_DIR = os.path.join(repo_root, 'sound_files')
 
+# List the sound directory once instead of stat()ing each file per test
+try:
+    _SOUND_FILES = frozenset(os.listdir(SOUND_DIR))
+except OSError:
+    _SOUND_FILES = frozenset()
+
 def wait_ms(ms):
     """Helper to wait for audio operations"""
     time.sleep(ms / 1000.0)
 
+def wait_until(predicate, timeout_ms=1000, poll_ms=1):
+    """Poll predicate until it returns True or timeout_ms elapses; returns its last result"""
+    deadline = time.monotonic() + timeout_ms / 1000.0
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return predicate()
+        time.sleep(poll_ms / 1000.0)
+    return True
+
 def get_sound_path(filename):
     """Get full path to a sound file"""
     return os.path.join(SOUND_DIR, filename)
 
 def sound_exists(filename):
     """Check if a sound file exists"""
-    return os.path.exists(get_sound_path(filename))
+    return filename in _SOUND_FILES
+
+@contextmanager
+def temp_group(audio):
+    """Create a group for the duration of a with-block and destroy it afterwards"""
+    group = audio.create_group()
+    try:
+        yield group
+    finally:
+        audio.destroy_group(group)
+
+def quiet_logging():
+    """Turn engine logging off for a test run; logging tests opt back in and restore it"""
+    game_audio.AudioManager.set_log_level(game_audio.LogLevel.Off)
+
+def restores_log_level(test):
+    """Decorator that puts the log level back after a test, even if it fails,
+    so a level set by one test never leaks into the tests after it"""
+    @wraps(test)
+    def wrapper(*args, **kwargs):
+        original = game_audio.AudioManager.get_log_level()
+        try:
+            return test(*args, **kwargs)
+        finally:
+            game_audio.AudioManager.set_log_level(original)
+    return wrapper
+
+def shutdown_audio():
+    """Shut the audio system down; as a run_tests() teardown this keeps a test
+    that fails before its own shutdown() from leaking a running engine"""
+    game_audio.AudioManager.get_instance().shutdown()
+
+def run_tests(tests, teardown=None):
+    """Run each test, reporting failures, and return (passed, failed)
+
+    teardown, if given, runs after every test whether or not it passed.
+    """
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"FAIL - {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR - {e}")
+            failed += 1
+        finally:
+            if teardown is not None:
+                teardown()
+    
+    return passed, failed